@@ -14,6 +14,8 @@ from telegram.ext import ContextTypes
 from io import BytesIO
 import logging
 
+from phase3_metrics import format_performance_stats
+
 logger = logging.getLogger(__name__)
 
 # ============================================================================
@@ -358,6 +360,10 @@ async def admin_stats_command(update: Update, context: ContextTypes.DEFAULT_TYPE
     )
     
     await update.message.reply_text(message, parse_mode='Markdown')
+    
+    # Phase 3 sections go in follow-up messages (together they exceed Telegram's limit)
+    for performance in format_performance_stats():
+        await update.message.reply_text(performance, parse_mode='Markdown')
 
 async def admin_maintenance_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Toggle maintenance mode - /admin_maintenance on/off"""
@@ -228,11 +228,12 @@ def create_feedback_keyboard():
     ]
     return InlineKeyboardMarkup(keyboard)
 
-async def request_feedback(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    """Request feedback after sending PDF"""
+async def request_feedback(update: Update, context: ContextTypes.DEFAULT_TYPE, message=None):
+    """Request feedback after sending PDF (replies to `message`, default: update.message)"""
     keyboard = create_feedback_keyboard()
+    message = message or update.message
     
-    await update.message.reply_text(
+    await message.reply_text(
         "⭐ *How was this solution?*\n\n"
         "Rate 1-10 so I can improve! 😊\n"
         "_Your feedback helps make me better!_",
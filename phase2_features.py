@@ -9,13 +9,17 @@ Phase: 2 - Enhanced
 
 import random
 import time
-from datetime import datetime
 from io import BytesIO
-from weasyprint import HTML
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram.ext import ContextTypes
 import logging
 
+from phase3_render import (
+    render_pdf, register_stylesheet, stylesheet_for, stylesheets, content_digest, pdf_store
+)
+from phase3_cache import pdf_flights, send_static_file
+from phase3_metrics import incr
+
 logger = logging.getLogger(__name__)
 
 # ============================================================================
@@ -122,6 +126,9 @@ def create_hint_keyboard(can_continue):
 # 🔥 DYNAMIC FLASHCARD SYSTEM - PDF GENERATION 🔥
 # ============================================================================
 
+FLASHCARD_TOPICS = ["SN1", "SN2", "NGP", "E1", "E2", "Carbocation", "Stereochemistry"]
+FLASHCARD_LAYOUT_VERSION = 2  # Bump when generate_flashcard_pdf's HTML changes (invalidates pre-rendered PDFs)
+
 def get_flashcards_from_knowledge(topic, chemistry_knowledge_base):
     """
     Get flashcards from GitHub knowledge base
@@ -153,237 +160,248 @@ def get_flashcards_from_knowledge(topic, chemistry_knowledge_base):
     logger.info(f"⚠️ No flashcards found for {topic}, using fallback")
     return []
 
-def generate_flashcard_pdf(topic, cards, mode='light'):
+def get_topic_flashcards(topic, chemistry_knowledge_base, fallback_flashcards):
+    """Knowledge base cards for a topic, else the flattened fallback categories"""
+    cards = get_flashcards_from_knowledge(topic, chemistry_knowledge_base)
+    if not cards:
+        cards = []
+        for category, category_cards in fallback_flashcards.get(topic, {}).items():
+            if isinstance(category_cards, list):
+                cards.extend(category_cards)
+    return cards
+
+FLASHCARD_CSS = """
+@page {
+    size: A4;
+    margin: 1.5cm;
+}
+
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: 'Helvetica', 'Arial', sans-serif;
+    font-size: 11pt;
+    line-height: 1.6;
+    color: #1a1a1a;
+    background: #ffffff;
+}
+
+.header {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    padding: 25px;
+    border-radius: 12px;
+    margin-bottom: 30px;
+    text-align: center;
+}
+
+.header h1 {
+    font-size: 26pt;
+    font-weight: bold;
+    margin-bottom: 8px;
+}
+
+.header .subtitle {
+    font-size: 12pt;
+    opacity: 0.95;
+}
+
+.card-container {
+    page-break-inside: avoid;
+    margin-bottom: 30px;
+    border: 2px solid #667eea;
+    border-radius: 12px;
+    overflow: hidden;
+    box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+}
+
+.card-number {
+    background: #667eea;
+    color: white;
+    padding: 8px 15px;
+    font-weight: bold;
+    font-size: 10pt;
+}
+
+.card-side {
+    padding: 20px;
+    min-height: 120px;
+}
+
+.card-front {
+    background: #f8f9ff;
+    border-bottom: 2px dashed #667eea;
+}
+
+.card-back {
+    background: #ffffff;
+}
+
+.card-label {
+    font-size: 9pt;
+    font-weight: bold;
+    color: #667eea;
+    text-transform: uppercase;
+    letter-spacing: 0.5px;
+    margin-bottom: 10px;
+}
+
+.card-content {
+    font-size: 11pt;
+    line-height: 1.6;
+    color: #2c3e50;
+}
+
+.card-content strong {
+    color: #667eea;
+    font-weight: bold;
+}
+
+.footer {
+    margin-top: 40px;
+    padding-top: 15px;
+    border-top: 2px solid #e0e0e0;
+    text-align: center;
+    font-size: 9pt;
+    color: #666;
+}
+
+.category-header {
+    background: #764ba2;
+    color: white;
+    padding: 15px;
+    margin: 30px 0 20px 0;
+    border-radius: 8px;
+    font-size: 14pt;
+    font-weight: bold;
+}
+"""
+
+FLASHCARD_DARK_CSS = """
+@page {
+    size: A4;
+    margin: 1.5cm;
+}
+
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: 'Helvetica', 'Arial', sans-serif;
+    font-size: 11pt;
+    line-height: 1.6;
+    color: #e8e8e8;
+    background: #1a1a1a;
+}
+
+.header {
+    background: linear-gradient(135deg, #4a9eff 0%, #00d9ff 100%);
+    color: white;
+    padding: 25px;
+    border-radius: 12px;
+    margin-bottom: 30px;
+    text-align: center;
+}
+
+.header h1 {
+    font-size: 26pt;
+    font-weight: bold;
+    margin-bottom: 8px;
+}
+
+.header .subtitle {
+    font-size: 12pt;
+    opacity: 0.95;
+}
+
+.card-container {
+    page-break-inside: avoid;
+    margin-bottom: 30px;
+    border: 2px solid #4a9eff;
+    border-radius: 12px;
+    overflow: hidden;
+    box-shadow: 0 4px 6px rgba(0,0,0,0.3);
+}
+
+.card-number {
+    background: #4a9eff;
+    color: white;
+    padding: 8px 15px;
+    font-weight: bold;
+    font-size: 10pt;
+}
+
+.card-side {
+    padding: 20px;
+    min-height: 120px;
+}
+
+.card-front {
+    background: #2a2a2a;
+    border-bottom: 2px dashed #4a9eff;
+}
+
+.card-back {
+    background: #1e1e1e;
+}
+
+.card-label {
+    font-size: 9pt;
+    font-weight: bold;
+    color: #4a9eff;
+    text-transform: uppercase;
+    letter-spacing: 0.5px;
+    margin-bottom: 10px;
+}
+
+.card-content {
+    font-size: 11pt;
+    line-height: 1.6;
+    color: #e8e8e8;
+}
+
+.card-content strong {
+    color: #00d9ff;
+    font-weight: bold;
+}
+
+.footer {
+    margin-top: 40px;
+    padding-top: 15px;
+    border-top: 2px solid #3a3a3a;
+    text-align: center;
+    font-size: 9pt;
+    color: #888;
+}
+
+.category-header {
+    background: #00d9ff;
+    color: #1a1a1a;
+    padding: 15px;
+    margin: 30px 0 20px 0;
+    border-radius: 8px;
+    font-size: 14pt;
+    font-weight: bold;
+}
+"""
+
+register_stylesheet("flashcards-light", FLASHCARD_CSS)
+register_stylesheet("flashcards-dark", FLASHCARD_DARK_CSS)
+register_stylesheet("flashcards-neon", FLASHCARD_DARK_CSS)
+
+async def generate_flashcard_pdf(topic, cards, mode='light'):
     """
     Generate beautiful PDF with all flashcards for a topic
     Each card shows FRONT and BACK on same page
     """
     
-    # CSS for flashcard PDF
-    css = """
-    @page {
-        size: A4;
-        margin: 1.5cm;
-    }
-    
-    * {
-        margin: 0;
-        padding: 0;
-        box-sizing: border-box;
-    }
-    
-    body {
-        font-family: 'Helvetica', 'Arial', sans-serif;
-        font-size: 11pt;
-        line-height: 1.6;
-        color: #1a1a1a;
-        background: #ffffff;
-    }
-    
-    .header {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 25px;
-        border-radius: 12px;
-        margin-bottom: 30px;
-        text-align: center;
-    }
-    
-    .header h1 {
-        font-size: 26pt;
-        font-weight: bold;
-        margin-bottom: 8px;
-    }
-    
-    .header .subtitle {
-        font-size: 12pt;
-        opacity: 0.95;
-    }
-    
-    .card-container {
-        page-break-inside: avoid;
-        margin-bottom: 30px;
-        border: 2px solid #667eea;
-        border-radius: 12px;
-        overflow: hidden;
-        box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-    }
-    
-    .card-number {
-        background: #667eea;
-        color: white;
-        padding: 8px 15px;
-        font-weight: bold;
-        font-size: 10pt;
-    }
-    
-    .card-side {
-        padding: 20px;
-        min-height: 120px;
-    }
-    
-    .card-front {
-        background: #f8f9ff;
-        border-bottom: 2px dashed #667eea;
-    }
-    
-    .card-back {
-        background: #ffffff;
-    }
-    
-    .card-label {
-        font-size: 9pt;
-        font-weight: bold;
-        color: #667eea;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-        margin-bottom: 10px;
-    }
-    
-    .card-content {
-        font-size: 11pt;
-        line-height: 1.6;
-        color: #2c3e50;
-    }
-    
-    .card-content strong {
-        color: #667eea;
-        font-weight: bold;
-    }
-    
-    .footer {
-        margin-top: 40px;
-        padding-top: 15px;
-        border-top: 2px solid #e0e0e0;
-        text-align: center;
-        font-size: 9pt;
-        color: #666;
-    }
-    
-    .category-header {
-        background: #764ba2;
-        color: white;
-        padding: 15px;
-        margin: 30px 0 20px 0;
-        border-radius: 8px;
-        font-size: 14pt;
-        font-weight: bold;
-    }
-    """
-    
-    # Dark mode CSS
-    if mode == 'dark':
-        css = """
-        @page {
-            size: A4;
-            margin: 1.5cm;
-        }
-        
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: 'Helvetica', 'Arial', sans-serif;
-            font-size: 11pt;
-            line-height: 1.6;
-            color: #e8e8e8;
-            background: #1a1a1a;
-        }
-        
-        .header {
-            background: linear-gradient(135deg, #4a9eff 0%, #00d9ff 100%);
-            color: white;
-            padding: 25px;
-            border-radius: 12px;
-            margin-bottom: 30px;
-            text-align: center;
-        }
-        
-        .header h1 {
-            font-size: 26pt;
-            font-weight: bold;
-            margin-bottom: 8px;
-        }
-        
-        .header .subtitle {
-            font-size: 12pt;
-            opacity: 0.95;
-        }
-        
-        .card-container {
-            page-break-inside: avoid;
-            margin-bottom: 30px;
-            border: 2px solid #4a9eff;
-            border-radius: 12px;
-            overflow: hidden;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.3);
-        }
-        
-        .card-number {
-            background: #4a9eff;
-            color: white;
-            padding: 8px 15px;
-            font-weight: bold;
-            font-size: 10pt;
-        }
-        
-        .card-side {
-            padding: 20px;
-            min-height: 120px;
-        }
-        
-        .card-front {
-            background: #2a2a2a;
-            border-bottom: 2px dashed #4a9eff;
-        }
-        
-        .card-back {
-            background: #1e1e1e;
-        }
-        
-        .card-label {
-            font-size: 9pt;
-            font-weight: bold;
-            color: #4a9eff;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            margin-bottom: 10px;
-        }
-        
-        .card-content {
-            font-size: 11pt;
-            line-height: 1.6;
-            color: #e8e8e8;
-        }
-        
-        .card-content strong {
-            color: #00d9ff;
-            font-weight: bold;
-        }
-        
-        .footer {
-            margin-top: 40px;
-            padding-top: 15px;
-            border-top: 2px solid #3a3a3a;
-            text-align: center;
-            font-size: 9pt;
-            color: #888;
-        }
-        
-        .category-header {
-            background: #00d9ff;
-            color: #1a1a1a;
-            padding: 15px;
-            margin: 30px 0 20px 0;
-            border-radius: 8px;
-            font-size: 14pt;
-            font-weight: bold;
-        }
-        """
-    
     # Build HTML content
     html_content = f"""
     <!DOCTYPE html>
@@ -391,13 +409,11 @@ def generate_flashcard_pdf(topic, cards, mode='light'):
     <head>
         <meta charset="UTF-8">
         <title>Flashcards: {topic}</title>
-        <style>{css}</style>
     </head>
     <body>
         <div class="header">
             <h1>🃏 {topic.upper()} FLASHCARDS</h1>
             <div class="subtitle">Study Guide | {len(cards)} Cards</div>
-            <div class="subtitle" style="margin-top: 10px;">Generated on {datetime.now().strftime('%B %d, %Y')}</div>
         </div>
     """
     
@@ -436,16 +452,63 @@ def generate_flashcard_pdf(topic, cards, mode='light'):
     </html>
     """
     
-    # Generate PDF
+    # Generate PDF (warm render pool - see phase3_render)
     try:
-        pdf_buffer = BytesIO()
-        HTML(string=html_content).write_pdf(pdf_buffer)
-        pdf_buffer.seek(0)
-        return pdf_buffer
+        return BytesIO(await render_pdf(html_content, stylesheet_for("flashcards", mode)))
     except Exception as e:
         logger.error(f"PDF generation error: {e}")
         raise
 
+def flashcard_pdf_digest(topic, cards, mode='light'):
+    """Content hash of everything that shapes a flashcard PDF"""
+    stylesheet_id = stylesheet_for("flashcards", mode)
+    return content_digest(FLASHCARD_LAYOUT_VERSION, topic, cards, stylesheets[stylesheet_id])
+
+async def get_flashcard_pdf(topic, cards, mode='light', record_stats=True):
+    """
+    Flashcard PDF bytes from the pre-rendered store, rendering on a miss
+    Keyed by the cards + stylesheet, so edited flashcards are re-rendered automatically.
+    """
+    digest = flashcard_pdf_digest(topic, cards, mode)
+    pdf = pdf_store.get(digest)
+    if record_stats:
+        incr('pdf_store_hits' if pdf is not None else 'pdf_store_misses')
+    if pdf is not None:
+        return pdf
+
+    async def render():
+        pdf = (await generate_flashcard_pdf(topic, cards, mode)).getvalue()
+        pdf_store.put(digest, pdf)
+        return pdf
+
+    pdf, _ = await pdf_flights.do(("flashcards", digest), render)
+    return pdf
+
+async def prerender_flashcards(chemistry_knowledge_base, fallback_flashcards):
+    """
+    Background job at startup: every topic in every flashcard stylesheet
+    Unchanged cards are already on disk; PDFs for cards that no longer exist are removed.
+    """
+    themes = [stylesheet_id.split("-", 1)[1] for stylesheet_id in stylesheets if stylesheet_id.startswith("flashcards-")]
+    keep = set()
+    for topic in FLASHCARD_TOPICS:
+        cards = get_topic_flashcards(topic, chemistry_knowledge_base, fallback_flashcards)
+        if not cards:
+            continue
+        for theme in themes:
+            digest = flashcard_pdf_digest(topic, cards, theme)
+            if digest in keep:
+                continue  # Theme shares its stylesheet text with one already done
+            try:
+                await get_flashcard_pdf(topic, cards, theme, record_stats=False)
+            except Exception as e:
+                logger.error(f"Flashcard pre-render error ({topic}/{theme}): {e}")
+                continue
+            keep.add(digest)
+
+    removed = pdf_store.prune(keep)
+    logger.info(f"🃏 Flashcard PDFs ready: {len(keep)} ({removed} stale removed)")
+
 # ============================================================================
 # PDF THEMES (Keep existing)
 # ============================================================================
@@ -609,13 +672,14 @@ body {
 strong { color: #ff6347; }
 """
 
+PDF_THEMES = {
+    "neon": THEME_NEON_CSS,
+    "minimal": THEME_MINIMAL_CSS,
+    "notebook": THEME_NOTEBOOK_CSS
+}
+
 def get_theme_css(theme_name):
-    themes = {
-        "neon": THEME_NEON_CSS,
-        "minimal": THEME_MINIMAL_CSS,
-        "notebook": THEME_NOTEBOOK_CSS
-    }
-    return themes.get(theme_name, themes["minimal"])
+    return PDF_THEMES.get(theme_name, PDF_THEMES["minimal"])
 
 # ============================================================================
 # COMMAND HANDLERS
@@ -744,7 +808,8 @@ async def handle_hint_reset(update: Update, context: ContextTypes.DEFAULT_TYPE):
         parse_mode='Markdown'
     )
 
-async def handle_flashcard_topic(update: Update, context: ContextTypes.DEFAULT_TYPE, topic):
+async def handle_flashcard_topic(update: Update, context: ContextTypes.DEFAULT_TYPE, topic,
+                                 chemistry_knowledge_base, fallback_flashcards):
     """Generate and send flashcard PDF for topic"""
     query = update.callback_query
     await query.answer("🃏 Generating flashcard PDF...")
@@ -758,22 +823,8 @@ async def handle_flashcard_topic(update: Update, context: ContextTypes.DEFAULT_T
     )
     
     try:
-        # Get flashcards from knowledge base
-        from ULTIMATE_JE import chemistry_knowledge_base
-        cards = get_flashcards_from_knowledge(topic, chemistry_knowledge_base)
-        
-        # If no cards from GitHub, use fallback
-        if not cards:
-            logger.info(f"Using fallback flashcards for {topic}")
-            # Import fallback from main file
-            from ULTIMATE_JE import FALLBACK_FLASHCARDS
-            topic_data = FALLBACK_FLASHCARDS.get(topic, {})
-            
-            # Flatten all categories
-            cards = []
-            for category, category_cards in topic_data.items():
-                if isinstance(category_cards, list):
-                    cards.extend(category_cards)
+        # Get flashcards from knowledge base (fallback cards if GitHub has none)
+        cards = get_topic_flashcards(topic, chemistry_knowledge_base, fallback_flashcards)
         
         if not cards:
             await query.edit_message_text(
@@ -783,19 +834,20 @@ async def handle_flashcard_topic(update: Update, context: ContextTypes.DEFAULT_T
             )
             return
         
-        # Get user preference for PDF mode
+        # Get user preference for PDF theme (/theme), else mode (/settings)
         user_id = query.from_user.id
         from phase1_features import get_user_preference
-        pdf_mode = get_user_preference(user_id, 'pdf_mode', 'light')
+        pdf_mode = get_user_preference(user_id, 'pdf_theme', None) or get_user_preference(user_id, 'pdf_mode', 'light')
         
-        # Generate PDF
-        pdf_buffer = generate_flashcard_pdf(topic, cards, mode=pdf_mode)
+        # Pre-rendered at startup - only renders if the cards changed since
+        async def pdf_file():
+            return BytesIO(await get_flashcard_pdf(topic, cards, mode=pdf_mode))
         
-        # Send PDF
-        filename = f"Flashcards_{topic}_{datetime.now().strftime('%Y%m%d')}.pdf"
+        # Send PDF (by file_id after the first upload of this exact PDF)
+        filename = f"Flashcards_{topic}.pdf"  # No date - the same PDF is reused by content hash
         
-        await query.message.reply_document(
-            document=pdf_buffer,
+        await send_static_file(
+            query.message.reply_document, "document", flashcard_pdf_digest(topic, cards, pdf_mode), pdf_file,
             filename=filename,
             caption=(
                 f"🃏 *{topic} Flashcards*\n\n"
@@ -13,6 +13,8 @@ import base64
 from io import BytesIO
 import logging
 
+from phase3_cache import send_static_file, content_key
+
 logger = logging.getLogger(__name__)
 
 # ============================================================================
@@ -577,13 +579,16 @@ def get_default_concepts(topic):
 async def visualize_molecule_command(update, context, formula):
     """Generate and send 3D molecule HTML"""
     try:
-        html_content = generate_3d_molecule_html(formula)
+        html_bytes = generate_3d_molecule_html(formula).encode('utf-8')
         
-        html_file = BytesIO(html_content.encode('utf-8'))
-        html_file.name = f"molecule_{formula}.html"
+        async def html_file():
+            html_file = BytesIO(html_bytes)
+            html_file.name = f"molecule_{formula}.html"
+            return html_file
         
-        await update.message.reply_document(
-            document=html_file,
+        # Same formula -> same HTML, so repeats are sent by file_id
+        await send_static_file(
+            update.message.reply_document, "document", content_key(html_bytes), html_file,
             filename=f"3D_{formula}.html",
             caption=f"🧬 *3D Molecule: {formula}*\n\n✨ NEW: Color legend included!\n\nOpen in browser for interactive view!\n_Drag to rotate, scroll to zoom_",
             parse_mode='Markdown'
@@ -596,13 +601,15 @@ async def visualize_molecule_command(update, context, formula):
 async def visualize_concept_map_command(update, context, topic):
     """Generate and send concept map HTML"""
     try:
-        html_content = generate_concept_map_html(topic)
+        html_bytes = generate_concept_map_html(topic).encode('utf-8')
         
-        html_file = BytesIO(html_content.encode('utf-8'))
-        html_file.name = f"concept_map_{topic}.html"
+        async def html_file():
+            html_file = BytesIO(html_bytes)
+            html_file.name = f"concept_map_{topic}.html"
+            return html_file
         
-        await update.message.reply_document(
-            document=html_file,
+        await send_static_file(
+            update.message.reply_document, "document", content_key(html_bytes), html_file,
             filename=f"ConceptMap_{topic}.html",
             caption=f"🗺️ *Concept Map: {topic}*\n\nInteractive mind map!\n_Drag nodes to explore connections_",
             parse_mode='Markdown'
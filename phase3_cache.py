@@ -0,0 +1,550 @@
+"""
+PHASE 3 CACHE MODULE
+Content-addressed solution cache: in-memory LRU + on-disk tier with TTL
+Single-flight coalescing of identical in-flight solves
+Text-keyed lookups from normalized problem transcriptions
+Telegram file_id reuse for static/deterministic documents
+Compressed solution archive with short IDs (re-theming old solutions)
+
+Author: @aryansmilezzz
+Phase: 3 (Performance)
+"""
+
+import os
+import re
+import json
+import zlib
+import sqlite3
+import asyncio
+import time
+import hashlib
+import unicodedata
+from collections import OrderedDict
+from io import BytesIO
+from PIL import Image
+from telegram.error import BadRequest
+import logging
+
+from phase3_metrics import incr, register_stats_section, perf_counters
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+SOLUTION_CACHE_DIR = "/app/data/solution_cache" if os.path.exists("/app/data") else "solution_cache"
+SOLUTION_CACHE_MEMORY_ITEMS = int(os.environ.get('SOLUTION_CACHE_MEMORY_ITEMS', 256))
+SOLUTION_CACHE_TTL_DAYS = float(os.environ.get('SOLUTION_CACHE_TTL_DAYS', 30))
+SOLUTION_CACHE_MAX_MB = float(os.environ.get('SOLUTION_CACHE_MAX_MB', 200))
+FILE_INDEX_MAX_ENTRIES = int(os.environ.get('FILE_INDEX_MAX_ENTRIES', 100000))
+SOLUTION_ARCHIVE_DB = "/app/data/solutions.db" if os.path.exists("/app/data") else "solutions.db"
+SOLUTION_ARCHIVE_KEEP_DAYS = float(os.environ.get('SOLUTION_ARCHIVE_KEEP_DAYS', 180))
+
+# ============================================================================
+# KEYS
+# ============================================================================
+
+def normalize_caption(caption):
+    """Collapse whitespace (case is kept - CO and Co are different!)"""
+    return " ".join((caption or "").split())
+
+def open_rgb_image(img_bytes):
+    """Decode image bytes to an RGB PIL image (transparency flattened to white)"""
+    img = Image.open(BytesIO(img_bytes))
+    if img.mode == 'RGBA':
+        bg = Image.new('RGB', img.size, (255, 255, 255))
+        bg.paste(img, mask=img.split()[3])
+        img = bg
+    elif img.mode != 'RGB':
+        img = img.convert('RGB')
+    return img
+
+def solution_key(img, caption=""):
+    """
+    Content hash of the decoded pixels + normalized caption
+    Same picture re-encoded with different JPEG metadata gives the same key
+    """
+    h = hashlib.sha256()
+    h.update(f"{img.size[0]}x{img.size[1]}:".encode())
+    h.update(img.tobytes())
+    h.update(b"\x00")
+    h.update(normalize_caption(caption).encode('utf-8'))
+    return h.hexdigest()
+
+OPTION_LINE = re.compile(r'^\(?([A-Da-d])[).:]\s*(.+)$')
+
+def normalize_problem_text(text):
+    """NFKC (₂ -> 2, ² -> 2, full-width -> ASCII) + collapsed whitespace per line"""
+    text = unicodedata.normalize('NFKC', text or "")
+    lines = (" ".join(line.split()) for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+def split_options(text):
+    """Normalized text -> (stem, [option text in A, B, C, D order])"""
+    stem, options = [], []
+    for line in normalize_problem_text(text).splitlines():
+        match = OPTION_LINE.match(line)
+        if match:
+            options.append(match.group(2).rstrip(' .'))
+        elif options:
+            options[-1] += " " + line  # Option wrapped onto the next line
+        else:
+            stem.append(line)
+    return " ".join(stem), options
+
+def problem_text_key(text):
+    """
+    (digest, options) for a transcription
+    Options are sorted inside the digest, so the same question with shuffled
+    options matches; `options` keeps this copy's order to tell the two apart.
+    """
+    stem, options = split_options(text)
+    h = hashlib.sha256(stem.lower().encode('utf-8'))
+    for option in sorted(option.lower() for option in options):
+        h.update(b"\x00" + option.encode('utf-8'))
+    return h.hexdigest(), options
+
+def same_problem_text(entry, text_key, options):
+    """Whether a cache entry was transcribed as this question, options in the same order"""
+    transcript = entry.get('transcript')
+    if not transcript or problem_text_key(transcript)[0] != text_key:
+        return False
+    return [option.lower() for option in entry.get('options') or []] == [option.lower() for option in options]
+
+def option_letter_map(cached_options, options):
+    """{cached letter: letter in this copy} or None if the options don't line up"""
+    if len(cached_options) != len(options):
+        return None
+    position = {option.lower(): i for i, option in enumerate(options)}
+    mapping = {}
+    for i, option in enumerate(cached_options):
+        if option.lower() not in position:
+            return None
+        mapping[chr(65 + i)] = chr(65 + position[option.lower()])
+    return mapping
+
+# ============================================================================
+# SOLUTION CACHE
+# ============================================================================
+
+class SolutionCache:
+    """Two-tier cache: {key: {'solution': str, 'caption': str, 'created': ts}}"""
+
+    def __init__(self, directory, memory_items, ttl_seconds, max_bytes):
+        self.directory = directory
+        self.memory_items = memory_items
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.memory = OrderedDict()
+        self.disk_bytes = None  # Scanned lazily on first write
+        self.evict_listeners = []  # fn(keys) - indexes pointing at solution keys drop them too
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _expired(self, entry):
+        return time.time() - entry.get('created', 0) > self.ttl_seconds
+
+    def _remember(self, key, entry):
+        self.memory[key] = entry
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_items:
+            self.memory.popitem(last=False)
+
+    def get(self, key, record_stats=True):
+        """Get cached entry or None"""
+        entry = self.memory.get(key)
+        if entry is not None:
+            if not self._expired(entry):
+                self.memory.move_to_end(key)
+                if record_stats:
+                    incr('solution_cache_memory_hits')
+                return entry
+            del self.memory[key]
+
+        path = self._path(key)
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            entry = None
+        except Exception as e:
+            logger.error(f"Solution cache read error: {e}")
+            entry = None
+
+        if entry is not None:
+            if not self._expired(entry):
+                self._remember(key, entry)
+                if record_stats:
+                    incr('solution_cache_disk_hits')
+                return entry
+            self._delete(path)
+            self._notify_evicted([key])
+
+        if record_stats:
+            incr('solution_cache_misses')
+        return None
+
+    def put(self, key, solution, caption="", **extra):
+        """Store solution in both tiers"""
+        entry = {'solution': solution, 'caption': normalize_caption(caption), 'created': time.time()}
+        entry.update(extra)
+        self._remember(key, entry)
+        incr('solution_cache_stores')
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            if self.disk_bytes is None:
+                self.disk_bytes = self._scan_size()
+
+            path = self._path(key)
+            old_size = os.path.getsize(path) if os.path.exists(path) else 0
+            tmp = f"{path}.tmp"
+            with open(tmp, 'w') as f:
+                json.dump(entry, f)
+            os.replace(tmp, path)
+            self.disk_bytes += os.path.getsize(path) - old_size
+
+            if self.disk_bytes > self.max_bytes:
+                self._evict()
+        except Exception as e:
+            logger.error(f"Solution cache write error: {e}")
+
+        return entry
+
+    def _scan_size(self):
+        total = 0
+        with os.scandir(self.directory) as it:
+            for item in it:
+                if item.name.endswith('.json'):
+                    total += item.stat().st_size
+        return total
+
+    def _delete(self, path):
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+            if self.disk_bytes is not None:
+                self.disk_bytes -= size
+        except FileNotFoundError:
+            pass
+
+    def keys_on_disk(self):
+        """Set of solution keys currently stored on disk"""
+        try:
+            with os.scandir(self.directory) as it:
+                return {item.name[:-5] for item in it if item.name.endswith('.json')}
+        except FileNotFoundError:
+            return set()
+
+    def _notify_evicted(self, keys):
+        for listener in self.evict_listeners:
+            try:
+                listener(keys)
+            except Exception as e:
+                logger.error(f"Solution cache evict listener error: {e}")
+
+    def _evict(self):
+        """Drop expired files, then oldest files until under 90% of the size budget"""
+        files = []
+        with os.scandir(self.directory) as it:
+            for item in it:
+                if item.name.endswith('.json'):
+                    st = item.stat()
+                    files.append((st.st_mtime, st.st_size, item.path))
+        files.sort()
+
+        now = time.time()
+        target = self.max_bytes * 0.9
+        evicted = []
+        for mtime, size, path in files:
+            if self.disk_bytes <= target and now - mtime <= self.ttl_seconds:
+                break
+            self._delete(path)
+            key = os.path.basename(path)[:-5]
+            self.memory.pop(key, None)
+            evicted.append(key)
+
+        self._notify_evicted(evicted)
+        incr('solution_cache_evictions', len(evicted))
+        logger.info(f"🧹 Solution cache: evicted {len(evicted)} files")
+
+    def disk_size_mb(self):
+        if self.disk_bytes is None:
+            return 0.0
+        return self.disk_bytes / (1024 * 1024)
+
+solution_cache = SolutionCache(
+    SOLUTION_CACHE_DIR,
+    SOLUTION_CACHE_MEMORY_ITEMS,
+    SOLUTION_CACHE_TTL_DAYS * 86400,
+    SOLUTION_CACHE_MAX_MB * 1024 * 1024
+)
+
+# ============================================================================
+# TELEGRAM FILE INDEX
+# ============================================================================
+
+class FileIndex:
+    """
+    Maps Telegram file_unique_id (+ caption) to a solution key
+    Forwarded/re-sent photos keep their file_unique_id, so they can be
+    answered without downloading the image at all.
+    Persisted as an append-only log: one "<index_key> <solution_key>" per line
+    (text_index reuses it with transcription digests in place of file_unique_id)
+    Solver worker processes share the log, so lookups first read whatever
+    the other processes appended since.
+    """
+
+    def __init__(self, path, max_entries):
+        self.path = path
+        self.max_entries = max_entries
+        self.entries = None  # Loaded lazily {index_key: solution_key}
+        self.log_lines = 0
+        self.log_stat = None  # (inode, bytes read) of the log
+
+    @staticmethod
+    def _index_key(file_unique_id, caption):
+        caption_hash = hashlib.sha1(normalize_caption(caption).encode('utf-8')).hexdigest()[:16]
+        return f"{file_unique_id}:{caption_hash}"
+
+    def _load(self):
+        self.entries = {}
+        self.log_lines = 0
+        self.log_stat = None
+        self._read(0)
+        logger.info(f"📇 File index: {len(self.entries)} photos")
+
+    def _read(self, offset):
+        """Apply the log from byte `offset` on"""
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(offset)
+                data = f.read()
+                inode = os.fstat(f.fileno()).st_ino
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.error(f"File index load error: {e}")
+            return
+
+        end = data.rfind(b"\n") + 1  # A line still being written is read next time
+        for line in data[:end].decode('utf-8', 'replace').splitlines():
+            parts = line.split()
+            if len(parts) == 2:
+                self.entries.pop(parts[0], None)  # Re-insert = most recent
+                self.entries[parts[0]] = parts[1]
+                self.log_lines += 1
+        self.log_stat = (inode, offset + end)
+
+    def _refresh(self):
+        """Load lazily, then pick up lines other processes appended"""
+        if self.entries is None:
+            self._load()
+            return
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return
+        if self.log_stat is None or st.st_ino != self.log_stat[0] or st.st_size < self.log_stat[1]:
+            self._load()  # Compacted by another process
+        elif st.st_size > self.log_stat[1]:
+            self._read(self.log_stat[1])
+
+    def get(self, file_unique_id, caption=""):
+        """Get solution key for a Telegram photo or None"""
+        self._refresh()
+        return self.entries.get(self._index_key(file_unique_id, caption))
+
+    def put(self, file_unique_id, caption, key):
+        """Remember which solution key a Telegram photo maps to"""
+        self._refresh()
+        index_key = self._index_key(file_unique_id, caption)
+        if self.entries.get(index_key) == key:
+            return
+
+        self.entries.pop(index_key, None)
+        self.entries[index_key] = key
+        while len(self.entries) > self.max_entries:
+            self.entries.pop(next(iter(self.entries)))
+
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            if self.log_lines >= 2 * self.max_entries:
+                self._compact()
+            else:
+                # Counted when _refresh reads it back, like other processes' lines
+                with open(self.path, 'a') as f:
+                    f.write(f"{index_key} {key}\n")
+        except Exception as e:
+            logger.error(f"File index write error: {e}")
+
+    def _compact(self):
+        tmp = f"{self.path}.tmp"
+        with open(tmp, 'w') as f:
+            for index_key, key in self.entries.items():
+                f.write(f"{index_key} {key}\n")
+            f.flush()
+            st = os.fstat(f.fileno())
+        os.replace(tmp, self.path)
+        self.log_lines = len(self.entries)
+        self.log_stat = (st.st_ino, st.st_size)
+
+file_index = FileIndex(os.path.join(SOLUTION_CACHE_DIR, "file_index.log"), FILE_INDEX_MAX_ENTRIES)
+text_index = FileIndex(os.path.join(SOLUTION_CACHE_DIR, "text_index.log"), FILE_INDEX_MAX_ENTRIES)
+upload_index = FileIndex(os.path.join(SOLUTION_CACHE_DIR, "upload_index.log"), FILE_INDEX_MAX_ENTRIES)
+
+# ============================================================================
+# TELEGRAM UPLOAD REUSE
+# ============================================================================
+
+def content_key(data):
+    """sha256 of bytes/str content - the upload_index key"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+async def send_static_file(send, field, digest, make_file, **kwargs):
+    """
+    Send deterministic content by the file_id of its first upload
+    send: bound reply_document / reply_photo; field: "document" or "photo"
+    digest: content hash (new content = new digest = fresh upload)
+    make_file(): coroutine function returning the bytes/file, only awaited to upload
+    """
+    file_id = upload_index.get(digest, field)
+    if file_id:
+        try:
+            message = await send(**{field: file_id}, **kwargs)
+            incr('upload_reuse_hits')
+            return message
+        except BadRequest as e:
+            logger.warning(f"Stored file_id rejected, uploading again: {e}")  # e.g. bot token changed
+
+    message = await send(**{field: await make_file()}, **kwargs)
+    remember_upload(digest, field, message)
+    incr('upload_reuse_misses')
+    return message
+
+def remember_upload(digest, field, message):
+    """Record the file_id of content sent some other way, so send_static_file can reuse it"""
+    sent = message.document if field == "document" else message.photo[-1]
+    upload_index.put(digest, field, sent.file_id)
+
+# ============================================================================
+# SOLUTION ARCHIVE
+# ============================================================================
+
+class SolutionArchive:
+    """
+    Every delivered solution, zlib-compressed, under a short integer ID
+    Unlike solution_cache (TTL + size budget) it keeps solutions long enough
+    for "render again in another theme" buttons on old messages.
+    One row per solution key - re-solving the same photo keeps its ID.
+    """
+
+    def __init__(self, path, keep_days):
+        self.path = path
+        self.keep_days = keep_days
+        self.db = None
+
+    def _conn(self):
+        if self.db is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self.db = sqlite3.connect(self.path, isolation_level=None)  # Autocommit
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS solutions ("
+                " id INTEGER PRIMARY KEY AUTOINCREMENT, cache_key TEXT NOT NULL UNIQUE,"
+                " solution BLOB NOT NULL, created REAL NOT NULL)"
+            )
+        return self.db
+
+    def put(self, cache_key, solution):
+        """Store (or refresh) a solution -> its ID"""
+        conn = self._conn()
+        conn.execute(
+            "INSERT INTO solutions (cache_key, solution, created) VALUES (?, ?, ?)"
+            " ON CONFLICT(cache_key) DO UPDATE SET solution = excluded.solution, created = excluded.created",
+            (cache_key, zlib.compress(solution.encode('utf-8'), 9), time.time())
+        )
+        return conn.execute("SELECT id FROM solutions WHERE cache_key = ?", (cache_key,)).fetchone()[0]
+
+    def get(self, solution_id):
+        row = self._conn().execute("SELECT solution FROM solutions WHERE id = ?", (solution_id,)).fetchone()
+        return zlib.decompress(row[0]).decode('utf-8') if row else None
+
+    def prune(self):
+        cutoff = time.time() - self.keep_days * 86400
+        return self._conn().execute("DELETE FROM solutions WHERE created < ?", (cutoff,)).rowcount
+
+    def count(self):
+        return self._conn().execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
+
+solution_archive = SolutionArchive(SOLUTION_ARCHIVE_DB, SOLUTION_ARCHIVE_KEEP_DAYS)
+
+# ============================================================================
+# SINGLE-FLIGHT
+# ============================================================================
+
+class SingleFlight:
+    """
+    At most one in-flight call per key
+    Duplicates arriving while it runs await the same task and get the same result
+    (or the same exception). Nothing is kept once the call finishes.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = {}  # {key: asyncio.Task}
+
+    async def do(self, key, fn):
+        """Run fn() (coroutine function) once per key -> (result, shared)"""
+        task = self.calls.get(key)
+        if task is not None:
+            incr(f"{self.name}_coalesced")
+            return await asyncio.shield(task), True
+
+        task = asyncio.ensure_future(fn())
+        self.calls[key] = task
+        task.add_done_callback(lambda _: self.calls.pop(key, None))
+        incr(f"{self.name}_leaders")
+        # Shield: a cancelled leader must not cancel the call its followers wait on
+        return await asyncio.shield(task), False
+
+    def in_flight(self, key):
+        return key in self.calls
+
+solve_flights = SingleFlight('solve')
+pdf_flights = SingleFlight('pdf')
+
+# ============================================================================
+# ADMIN STATS
+# ============================================================================
+
+def _archive_count():
+    try:
+        return solution_archive.count()
+    except Exception as e:
+        return f"error: {str(e)[:30]}"
+
+def _solution_cache_stats():
+    hits = perf_counters['solution_cache_memory_hits'] + perf_counters['solution_cache_disk_hits']
+    lookups = hits + perf_counters['solution_cache_misses']
+    hit_rate = hits / lookups * 100 if lookups else 0
+    return [
+        ("Hits", f"{hits} ({hit_rate:.0f}%)"),
+        ("Memory / disk hits", f"{perf_counters['solution_cache_memory_hits']} / {perf_counters['solution_cache_disk_hits']}"),
+        ("Misses", perf_counters['solution_cache_misses']),
+        ("Downloads skipped (file_unique_id)", perf_counters['file_index_hits']),
+        ("Transcription hits (same text)", f"{perf_counters['text_cache_hits']} ({perf_counters['text_cache_reordered']} reordered, solved fresh)"),
+        ("Entries in memory", len(solution_cache.memory)),
+        ("Disk size", f"{solution_cache.disk_size_mb():.1f} MB"),
+        ("Evictions", perf_counters['solution_cache_evictions']),
+        ("Coalesced duplicate solves", f"{perf_counters['solve_coalesced']} ({len(solve_flights.calls)} in flight)"),
+        ("Coalesced PDF renders", perf_counters['pdf_coalesced']),
+        ("Archived solutions / re-themed", f"{_archive_count()} / {perf_counters['solutions_rethemed']}"),
+        ("Uploads skipped (file_id reuse)", f"{perf_counters['upload_reuse_hits']} / {perf_counters['upload_reuse_hits'] + perf_counters['upload_reuse_misses']}"),
+    ]
+
+register_stats_section("⚡ Solution Cache", _solution_cache_stats)
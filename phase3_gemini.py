@@ -0,0 +1,559 @@
+"""
+PHASE 3 GEMINI MODULE
+Shared, pooled HTTP client for Gemini calls (keep-alive + HTTP/2)
+Health-aware API key pool (token buckets, latency EWMA, circuit breakers)
+Streaming responses (streamGenerateContent over SSE)
+Hedged requests for tail latency (budget-capped)
+Retry policy: end-to-end deadline, jittered backoff, error classification, Retry-After
+
+Author: @aryansmilezzz
+Phase: 3 (Performance)
+"""
+
+import os
+import re
+import json
+import time
+import random
+import asyncio
+import contextvars
+import httpx
+import logging
+
+from phase3_metrics import incr, observe, percentile, register_stats_section, perf_counters, perf_latencies
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401 - HTTP/2 support for httpx (pip install httpx[http2])
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+GEMINI_API_BASE = os.environ.get('GEMINI_API_BASE', "https://generativelanguage.googleapis.com/v1beta")
+GEMINI_HTTP2 = os.environ.get('GEMINI_HTTP2', '1') == '1'
+GEMINI_POOL_MAX_CONNECTIONS = int(os.environ.get('GEMINI_POOL_MAX_CONNECTIONS', 20))
+GEMINI_POOL_MAX_KEEPALIVE = int(os.environ.get('GEMINI_POOL_MAX_KEEPALIVE', 10))
+GEMINI_KEEPALIVE_EXPIRY = float(os.environ.get('GEMINI_KEEPALIVE_EXPIRY', 120))
+GEMINI_TIMEOUT = float(os.environ.get('GEMINI_TIMEOUT', 300))
+GEMINI_STREAMING = os.environ.get('GEMINI_STREAMING', '1') == '1'
+GEMINI_HEDGING = os.environ.get('GEMINI_HEDGING', '0') == '1'
+GEMINI_HEDGE_PERCENTILE = float(os.environ.get('GEMINI_HEDGE_PERCENTILE', 95))
+GEMINI_HEDGE_MAX_RATE = float(os.environ.get('GEMINI_HEDGE_MAX_RATE', 0.1))  # Hedges per request
+HEDGE_MIN_SAMPLES = 10  # Latency history needed before hedging a call type
+HEDGE_BURST = 3
+
+# Retry policy
+GEMINI_SOLVE_DEADLINE = float(os.environ.get('GEMINI_SOLVE_DEADLINE', 420))  # Seconds, whole solve incl. retries - above the 2-5 min users are told
+GEMINI_MAX_ATTEMPTS = int(os.environ.get('GEMINI_MAX_ATTEMPTS', 4))
+GEMINI_RETRY_BASE = 1.0  # Backoff before retry n: uniform(0, min(MAX, BASE * 2^n))
+GEMINI_RETRY_MAX_BACKOFF = 20.0
+RETRYABLE_STATUS = {408, 429, 500, 502, 503, 504}
+KEY_STATUS = {401, 403}  # This key is bad - another key may work
+BLOCK_REASONS = {"SAFETY", "PROHIBITED_CONTENT", "BLOCKLIST", "SPII", "OTHER"}
+
+# Key pool (per key limits - free tier defaults)
+GEMINI_KEY_RPM = float(os.environ.get('GEMINI_KEY_RPM', 15))
+GEMINI_KEY_TPM = float(os.environ.get('GEMINI_KEY_TPM', 1000000))
+GEMINI_BREAKER_FAILURES = int(os.environ.get('GEMINI_BREAKER_FAILURES', 3))
+GEMINI_BREAKER_COOLDOWN = float(os.environ.get('GEMINI_BREAKER_COOLDOWN', 60))
+LATENCY_EWMA_ALPHA = 0.3
+
+# ============================================================================
+# SHARED CLIENT
+# ============================================================================
+
+gemini_client = None
+
+def _create_client():
+    http2 = GEMINI_HTTP2 and H2_AVAILABLE
+    if GEMINI_HTTP2 and not H2_AVAILABLE:
+        logger.warning("⚠️ HTTP/2 requested but 'h2' not installed - using HTTP/1.1 keep-alive")
+
+    limits = httpx.Limits(
+        max_connections=GEMINI_POOL_MAX_CONNECTIONS,
+        max_keepalive_connections=GEMINI_POOL_MAX_KEEPALIVE,
+        keepalive_expiry=GEMINI_KEEPALIVE_EXPIRY
+    )
+    logger.info(f"🌐 Gemini client: HTTP/{'2' if http2 else '1.1'}, pool {GEMINI_POOL_MAX_CONNECTIONS}")
+    return httpx.AsyncClient(http2=http2, limits=limits, timeout=GEMINI_TIMEOUT)
+
+async def start_gemini_client():
+    """Create the app-scoped client (call from startup)"""
+    global gemini_client
+    if gemini_client is None or gemini_client.is_closed:
+        gemini_client = _create_client()
+    return gemini_client
+
+async def close_gemini_client():
+    """Close the client and its pooled connections (call on shutdown)"""
+    global gemini_client
+    if gemini_client is not None:
+        await gemini_client.aclose()
+        gemini_client = None
+        logger.info("🌐 Gemini client closed")
+
+def get_gemini_client():
+    """Get the shared client, creating it on first use"""
+    global gemini_client
+    if gemini_client is None or gemini_client.is_closed:
+        gemini_client = _create_client()
+    return gemini_client
+
+# ============================================================================
+# ERRORS
+# ============================================================================
+
+class GeminiAPIError(Exception):
+    """Non-200 (or blocked) response from the Gemini API"""
+
+    def __init__(self, status_code, body="", retry_after=None, retryable=None):
+        self.status_code = status_code
+        self.body = body
+        self.retry_after = retry_after  # Seconds the server asked us to wait
+        if retryable is None:
+            retryable = status_code in RETRYABLE_STATUS or status_code in KEY_STATUS
+        self.retryable = retryable
+        super().__init__(f"API {status_code}: {body[:100]}")
+
+class GeminiDeadlineExceeded(Exception):
+    """The solve's end-to-end deadline ran out"""
+
+def parse_retry_after(headers, body):
+    """Retry-After header (seconds) or google.rpc.RetryInfo retryDelay ("37s") in the body"""
+    value = headers.get('retry-after')
+    if value:
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    match = re.search(r'"retryDelay"\s*:\s*"([\d.]+)s"', body or "")
+    return float(match.group(1)) if match else None
+
+def api_error(resp, body):
+    return GeminiAPIError(resp.status_code, body, parse_retry_after(resp.headers, body))
+
+def check_blocked(data):
+    """Raise a non-retryable error if the prompt or answer was blocked"""
+    reason = (data.get('promptFeedback') or {}).get('blockReason')
+    if not reason:
+        candidates = data.get('candidates') or []
+        finish = candidates[0].get('finishReason') if candidates else None
+        if finish in BLOCK_REASONS:
+            reason = finish
+    if reason:
+        incr('gemini_blocked')
+        raise GeminiAPIError(200, f"Blocked: {reason}", retryable=False)
+
+def is_retryable(error):
+    if isinstance(error, GeminiAPIError):
+        return error.retryable
+    return isinstance(error, (httpx.HTTPError, asyncio.TimeoutError))
+
+# ============================================================================
+# CONNECTION REUSE TRACKING
+# ============================================================================
+
+async def _trace(event_name, info):
+    """httpcore trace hook - a new TCP connect means the pool had nothing to reuse"""
+    if event_name == "connection.connect_tcp.complete":
+        incr('gemini_tcp_connects')
+    elif event_name == "connection.start_tls.complete":
+        incr('gemini_tls_handshakes')
+    elif event_name == "http2.send_request_headers.started":
+        incr('gemini_http2_requests')
+
+async def gemini_request(method, url, **kwargs):
+    """Request through the shared client, recording connection reuse"""
+    incr('gemini_http_requests')
+    return await get_gemini_client().request(method, url, extensions={"trace": _trace}, **kwargs)
+
+async def gemini_post(url, **kwargs):
+    return await gemini_request("POST", url, **kwargs)
+
+def gemini_model_url(model, method, key):
+    return f"{GEMINI_API_BASE}/models/{model}:{method}?key={key}"
+
+# ============================================================================
+# STREAMING
+# ============================================================================
+
+def _chunk_text(chunk):
+    try:
+        parts = chunk['candidates'][0]['content']['parts']
+    except (KeyError, IndexError, TypeError):
+        return ""
+    return "".join(part.get('text', '') for part in parts)
+
+async def gemini_stream(model, key, payload, on_text=None):
+    """
+    streamGenerateContent over SSE
+    on_text(full_text_so_far) is awaited after every chunk.
+    Returns (full_text, usage_metadata)
+    """
+    url = gemini_model_url(model, "streamGenerateContent", key) + "&alt=sse"
+    incr('gemini_http_requests')
+    incr('gemini_stream_requests')
+
+    text = ""
+    usage = {}
+    sent_at = time.perf_counter()
+    client = get_gemini_client()
+    async with client.stream("POST", url, json=payload, extensions={"trace": _trace}) as resp:
+        if resp.status_code != 200:
+            body = (await resp.aread()).decode('utf-8', 'replace')
+            raise api_error(resp, body)
+
+        async for line in resp.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            try:
+                chunk = json.loads(line[5:])
+            except json.JSONDecodeError:
+                continue
+
+            check_blocked(chunk)
+            usage = chunk.get('usageMetadata', usage)
+            piece = _chunk_text(chunk)
+            if piece:
+                if not text:
+                    observe('gemini_first_chunk', time.perf_counter() - sent_at)
+                text += piece
+                if on_text:
+                    await on_text(text)
+
+    if not text:
+        raise GeminiAPIError(200, "Empty streamed response", retryable=True)
+    return text, usage
+
+async def gemini_generate_content(model, key, payload):
+    """Non-streaming generateContent -> (text, usage_metadata)"""
+    resp = await gemini_post(gemini_model_url(model, "generateContent", key), json=payload)
+    if resp.status_code != 200:
+        raise api_error(resp, resp.text)
+
+    result = resp.json()
+    check_blocked(result)
+    text = _chunk_text(result)
+    if not text:
+        raise GeminiAPIError(200, "Empty response", retryable=True)
+    return text, result.get('usageMetadata', {})
+
+# ============================================================================
+# DEADLINES
+# ============================================================================
+
+# End-to-end deadline (time.time()) for the current solve - inherited by
+# tasks it spawns (parallel strategies, hedges), so every attempt shares it
+solve_deadline = contextvars.ContextVar('solve_deadline', default=None)
+
+def start_deadline(seconds=None):
+    """Set the deadline for this solve (call at the top of the solve)"""
+    return solve_deadline.set(time.time() + (seconds or GEMINI_SOLVE_DEADLINE))
+
+def time_left():
+    """Seconds until the deadline (GEMINI_TIMEOUT when no deadline is set)"""
+    deadline = solve_deadline.get()
+    if deadline is None:
+        return GEMINI_TIMEOUT
+    return deadline - time.time()
+
+def backoff_delay(attempt):
+    """Full-jitter exponential backoff"""
+    return random.uniform(0, min(GEMINI_RETRY_MAX_BACKOFF, GEMINI_RETRY_BASE * 2 ** attempt))
+
+# ============================================================================
+# KEY POOL
+# ============================================================================
+
+def estimate_tokens(text):
+    """Rough token estimate (~4 chars per token)"""
+    return len(text) // 4 + 1
+
+class TokenBucket:
+    """Refills `per_minute` tokens per minute, holds at most one minute's worth"""
+
+    def __init__(self, per_minute):
+        self.capacity = per_minute
+        self.rate = per_minute / 60.0
+        self.tokens = per_minute
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount):
+        """Seconds until `amount` tokens are available (0 = now)"""
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def take(self, amount):
+        self._refill()
+        self.tokens -= min(amount, self.capacity)
+
+    def give_back(self, amount):
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+    def drain(self):
+        self.tokens = min(self.tokens, 0)
+        self.updated = time.monotonic()
+
+class KeyState:
+    """Health + load of one API key"""
+
+    def __init__(self, index, key):
+        self.index = index
+        self.key = key
+        self.rpm = TokenBucket(GEMINI_KEY_RPM)
+        self.tpm = TokenBucket(GEMINI_KEY_TPM)
+        self.in_flight = 0
+        self.latency_ewma = None
+        self.consecutive_failures = 0
+        self.breaker = "closed"  # closed / open / half_open
+        self.opened_at = 0.0
+        self.successes = 0
+        self.failures = 0
+        self.retry_after_until = 0.0  # monotonic - server-requested pause
+
+    @property
+    def label(self):
+        return f"Key {self.index + 1}"
+
+    def breaker_ready(self, now):
+        """Can this key take a request right now (breaker-wise)?"""
+        if self.breaker == "closed":
+            return True
+        if self.breaker == "open" and now - self.opened_at >= GEMINI_BREAKER_COOLDOWN:
+            return True  # Cooldown over - next request is the half-open probe
+        return False  # Open, or half-open probe already running
+
+    def load_score(self):
+        """Lower is better: in-flight requests weighted by typical latency"""
+        latency = self.latency_ewma if self.latency_ewma is not None else 30.0
+        return (self.in_flight + 1) * latency
+
+class KeyPool:
+    """
+    Least-loaded scheduling across GEMINI_API_KEYS
+    Concurrent solves spread over all healthy keys instead of
+    piling onto one until it returns 429.
+    """
+
+    def __init__(self, keys):
+        self.states = [KeyState(i, key) for i, key in enumerate(keys)]
+        self.lock = asyncio.Lock()
+
+    async def acquire(self, estimated_tokens=1000, exclude=()):
+        """Wait for the best available key and reserve capacity on it"""
+        while True:
+            async with self.lock:
+                now = time.monotonic()
+                candidates = [s for s in self.states if s.breaker_ready(now)]
+                preferred = [s for s in candidates if s.index not in exclude]
+                candidates = preferred or candidates
+
+                ready = []
+                waits = []
+                for state in candidates:
+                    wait = max(
+                        state.rpm.wait_time(1),
+                        state.tpm.wait_time(estimated_tokens),
+                        state.retry_after_until - now
+                    )
+                    if wait == 0:
+                        ready.append(state)
+                    else:
+                        waits.append(wait)
+
+                if ready:
+                    state = min(ready, key=KeyState.load_score)
+                    if state.breaker == "open":
+                        state.breaker = "half_open"
+                        logger.info(f"🔌 {state.label}: half-open probe")
+                    state.rpm.take(1)
+                    state.tpm.take(estimated_tokens)
+                    state.in_flight += 1
+                    return state
+
+                if waits:
+                    delay = min(waits)
+                else:
+                    # Every breaker is open - wait for the first cooldown to end
+                    delay = min(GEMINI_BREAKER_COOLDOWN - (now - s.opened_at) for s in self.states)
+
+            incr('gemini_key_waits')
+            await asyncio.sleep(min(max(delay, 0.05), 5.0))
+
+    def release(self, state, ok, latency=None, estimated_tokens=0, used_tokens=None, rate_limited=False,
+                retry_after=None, key_fault=True):
+        """
+        Report the outcome of a request made with `state`
+        key_fault=False: the request failed for reasons that aren't the key's
+        (bad request, blocked content) - don't count it towards the breaker
+        """
+        state.in_flight -= 1
+        if retry_after:
+            state.retry_after_until = max(state.retry_after_until, time.monotonic() + retry_after)
+
+        if used_tokens is not None and used_tokens < estimated_tokens:
+            state.tpm.give_back(estimated_tokens - used_tokens)
+
+        if ok:
+            state.successes += 1
+            state.consecutive_failures = 0
+            if latency is not None:
+                if state.latency_ewma is None:
+                    state.latency_ewma = latency
+                else:
+                    state.latency_ewma = LATENCY_EWMA_ALPHA * latency + (1 - LATENCY_EWMA_ALPHA) * state.latency_ewma
+            if state.breaker != "closed":
+                logger.info(f"🔌 {state.label}: breaker closed")
+            state.breaker = "closed"
+            return
+
+        if not key_fault:
+            if state.breaker == "half_open":
+                state.breaker = "closed"  # It answered - the key itself is fine
+            return
+
+        state.failures += 1
+        state.consecutive_failures += 1
+        if rate_limited:
+            state.rpm.drain()
+
+        if state.breaker == "half_open" or state.consecutive_failures >= GEMINI_BREAKER_FAILURES:
+            state.breaker = "open"
+            state.opened_at = time.monotonic()
+            incr('gemini_breaker_trips')
+            logger.warning(f"🔌 {state.label}: breaker OPEN for {GEMINI_BREAKER_COOLDOWN:.0f}s")
+
+    def cancel(self, state, elapsed):
+        """Request abandoned by us (lost a hedge race) - not the key's fault, but it was slow"""
+        state.in_flight -= 1
+        if state.latency_ewma is not None:
+            state.latency_ewma = LATENCY_EWMA_ALPHA * elapsed + (1 - LATENCY_EWMA_ALPHA) * state.latency_ewma
+        if state.breaker == "half_open":
+            state.breaker = "open"  # Probe didn't finish - let another request probe
+        incr('gemini_cancelled')
+
+key_pool = None
+
+def init_key_pool(keys):
+    global key_pool
+    key_pool = KeyPool(keys)
+    return key_pool
+
+# ============================================================================
+# HEDGING
+# ============================================================================
+
+class HedgeBudget:
+    """Retry-budget style cap: each request earns max_rate credits, each hedge spends one"""
+
+    def __init__(self, max_rate, burst):
+        self.max_rate = max_rate
+        self.burst = burst
+        self.credits = burst
+
+    def record_request(self):
+        self.credits = min(self.burst, self.credits + self.max_rate)
+
+    def try_spend(self):
+        if self.credits < 1:
+            return False
+        self.credits -= 1
+        return True
+
+hedge_budget = HedgeBudget(GEMINI_HEDGE_MAX_RATE, HEDGE_BURST)
+
+def hedge_delay(latency_name):
+    """Seconds to wait before hedging, or None without enough history"""
+    samples = perf_latencies.get(latency_name)
+    if not samples or len(samples) < HEDGE_MIN_SAMPLES:
+        return None
+    return percentile(latency_name, GEMINI_HEDGE_PERCENTILE)
+
+async def run_hedged(start_call, latency_name):
+    """
+    start_call(hedge: bool) -> coroutine
+    Starts the primary call; if it hasn't finished after hedge_delay() and the
+    budget allows, starts a duplicate and returns whichever succeeds first.
+    The other one is cancelled.
+    """
+    delay = hedge_delay(latency_name) if GEMINI_HEDGING else None
+    if delay is None:
+        return await start_call(False)
+
+    hedge_budget.record_request()
+    primary = asyncio.ensure_future(start_call(False))
+    done, _ = await asyncio.wait({primary}, timeout=delay)
+    if done or not hedge_budget.try_spend():
+        return await primary
+
+    incr('gemini_hedges')
+    logger.info(f"🏇 Hedging {latency_name} after {delay:.0f}s")
+    hedge = asyncio.ensure_future(start_call(True))
+    pending = {primary, hedge}
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    if task is hedge:
+                        incr('gemini_hedge_wins')
+                    return task.result()
+            if not pending:
+                return await task  # Both failed - raise the last error
+    finally:
+        for task in pending:
+            task.cancel()
+
+# ============================================================================
+# ADMIN STATS
+# ============================================================================
+
+def _key_pool_stats():
+    if key_pool is None:
+        return []
+    rows = []
+    for state in key_pool.states:
+        latency = f"{state.latency_ewma:.1f}s" if state.latency_ewma is not None else "n/a"
+        rows.append((
+            state.label,
+            f"{state.breaker}, {state.in_flight} in flight, {latency} avg, {state.successes} ok / {state.failures} failed"
+        ))
+    rows.append(("Breaker trips", perf_counters['gemini_breaker_trips']))
+    rows.append(("Retries / fatal / blocked",
+                 f"{perf_counters['gemini_retries']} / {perf_counters['gemini_fatal_errors']} / {perf_counters['gemini_blocked']}"))
+    if GEMINI_HEDGING:
+        rows.append(("Hedges (won / issued)", f"{perf_counters['gemini_hedge_wins']} / {perf_counters['gemini_hedges']}"))
+        rows.append(("Cancelled requests", perf_counters['gemini_cancelled']))
+    rows.append(("Waits for capacity", perf_counters['gemini_key_waits']))
+    return rows
+
+def _http_stats():
+    requests = perf_counters['gemini_http_requests']
+    connects = perf_counters['gemini_tcp_connects']
+    reused = max(0, requests - connects)
+    reuse_rate = reused / requests * 100 if requests else 0
+    return [
+        ("Requests", requests),
+        ("New connections", connects),
+        ("TLS handshakes", perf_counters['gemini_tls_handshakes']),
+        ("Reused connections", f"{reused} ({reuse_rate:.0f}%)"),
+        ("HTTP/2 requests", perf_counters['gemini_http2_requests']),
+        ("Streamed requests", perf_counters['gemini_stream_requests']),
+        ("First chunk (p50)", f"{percentile('gemini_first_chunk', 50, 0):.1f}s"),
+    ]
+
+register_stats_section("🌐 Gemini Connections", _http_stats)
+register_stats_section("🔑 Gemini Keys", _key_pool_stats)
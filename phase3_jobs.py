@@ -0,0 +1,313 @@
+"""
+PHASE 3 JOBS MODULE
+Durable photo-solve jobs (SQLite) so a restart doesn't drop in-flight solves
+Stages: queued -> downloaded -> solved -> rendered -> delivered (or failed)
+Doubles as the local queue between the frontend and solver worker processes
+
+Author: @aryansmilezzz
+Phase: 3 (Performance)
+"""
+
+import os
+import time
+import sqlite3
+import logging
+
+from phase3_metrics import incr, register_stats_section, perf_counters
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+JOBS_DB = "/app/data/jobs.db" if os.path.exists("/app/data") else "jobs.db"
+JOB_MAX_RESUMES = int(os.environ.get('JOB_MAX_RESUMES', 3))  # Give up on jobs that keep dying
+JOB_RESUME_MAX_AGE_HOURS = float(os.environ.get('JOB_RESUME_MAX_AGE_HOURS', 24))
+JOB_KEEP_DAYS = 7  # Finished jobs are pruned after this
+JOB_LEASE_SECONDS = float(os.environ.get('JOB_LEASE_SECONDS', 600))  # Claimed job with no progress -> worker died
+
+JOB_STAGES = ["queued", "downloaded", "solved", "rendered", "delivered"]
+FINISHED_STAGES = ("delivered", "failed")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    chat_id INTEGER NOT NULL,
+    message_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    username TEXT,
+    file_id TEXT NOT NULL,
+    file_unique_id TEXT NOT NULL,
+    caption TEXT NOT NULL DEFAULT '',
+    allow_similar INTEGER NOT NULL DEFAULT 1,
+    stage TEXT NOT NULL DEFAULT 'queued',
+    cache_key TEXT,
+    solution TEXT,
+    resumes INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    created REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_stage ON jobs (stage);
+CREATE INDEX IF NOT EXISTS jobs_user ON jobs (user_id);
+CREATE INDEX IF NOT EXISTS jobs_cache_key ON jobs (cache_key);
+"""
+
+# Claim order, mirroring solve_scheduler's fair share: priority, then the
+# user's Nth unfinished job behind everyone's (N-1)th, then age
+CLAIM_ORDER = (
+    "priority,"
+    " (SELECT COUNT(*) FROM jobs AS o WHERE o.user_id = jobs.user_id AND o.stage NOT IN (?, ?) AND o.id < jobs.id),"
+    " id"
+)
+
+# Columns added after the first release: (name, definition)
+MIGRATIONS = [
+    ("pdf_mode", "TEXT"),
+    ("priority", "INTEGER NOT NULL DEFAULT 2"),
+    ("worker", "TEXT"),
+    ("status_message_id", "INTEGER"),  # "Queued" message the frontend sent, edited by the worker
+]
+
+# ============================================================================
+# STORE
+# ============================================================================
+
+class JobStore:
+    """
+    One row per photo solve
+    The solution text is written with the 'solved' stage, so a job resumed
+    after a restart renders/delivers it without calling Gemini again.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.db = None
+
+    def _conn(self):
+        if self.db is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self.db = sqlite3.connect(self.path, isolation_level=None)  # Autocommit
+            self.db.row_factory = sqlite3.Row
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.execute("PRAGMA synchronous=NORMAL")
+            self.db.executescript(SCHEMA)
+            existing = {row[1] for row in self.db.execute("PRAGMA table_info(jobs)")}
+            for name, definition in MIGRATIONS:
+                if name not in existing:
+                    self.db.execute(f"ALTER TABLE jobs ADD COLUMN {name} {definition}")
+        return self.db
+
+    def create(self, chat_id, message_id, user_id, username, file_id, file_unique_id, caption, allow_similar=True,
+               pdf_mode=None, priority=2, worker=None):
+        """worker=None leaves the job for solver workers to claim"""
+        now = time.time()
+        cur = self._conn().execute(
+            "INSERT INTO jobs (chat_id, message_id, user_id, username, file_id, file_unique_id, caption,"
+            " allow_similar, pdf_mode, priority, worker, created, updated)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (chat_id, message_id, user_id, username, file_id, file_unique_id, caption,
+             int(allow_similar), pdf_mode, priority, worker, now, now)
+        )
+        incr('jobs_created')
+        return cur.lastrowid
+
+    def advance(self, job_id, stage, **fields):
+        """Move a job to `stage`, storing any extra columns (cache_key, solution, error)"""
+        fields['stage'] = stage
+        fields['updated'] = time.time()
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        self._conn().execute(f"UPDATE jobs SET {columns} WHERE id = ?", (*fields.values(), job_id))
+        incr(f"jobs_{stage}")
+
+    def fail(self, job_id, error):
+        self.advance(job_id, "failed", error=str(error)[:500])
+
+    def get(self, job_id):
+        row = self._conn().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return dict(row) if row else None
+
+    def claim_unfinished(self):
+        """
+        Jobs a previous process left unfinished, oldest first
+        Each is counted as a resume; too old / too often resumed jobs are failed instead.
+        """
+        conn = self._conn()
+        rows = conn.execute(
+            "SELECT * FROM jobs WHERE stage NOT IN (?, ?) ORDER BY id", FINISHED_STAGES
+        ).fetchall()
+
+        oldest = time.time() - JOB_RESUME_MAX_AGE_HOURS * 3600
+        jobs = []
+        for row in rows:
+            job = dict(row)
+            if job['created'] < oldest:
+                self.fail(job['id'], "expired before resume")
+            elif job['resumes'] >= JOB_MAX_RESUMES:
+                self.fail(job['id'], f"gave up after {job['resumes']} resumes")
+            else:
+                conn.execute("UPDATE jobs SET resumes = resumes + 1 WHERE id = ?", (job['id'],))
+                job['resumes'] += 1
+                jobs.append(job)
+        return jobs
+
+    def claim_next(self, worker, per_user):
+        """
+        Atomically take the best unowned job for `worker` (see CLAIM_ORDER)
+        Users who already have per_user jobs running on any worker are skipped,
+        so one user's burst can't fill every worker's slots.
+        Jobs whose worker stopped making progress for JOB_LEASE_SECONDS are taken over as resumes.
+        Returns the job dict or None.
+        """
+        conn = self._conn()
+        while True:
+            now = time.time()
+            stale = now - JOB_LEASE_SECONDS
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT * FROM jobs WHERE stage NOT IN (?, ?) AND (worker IS NULL OR updated < ?)"
+                    " AND (SELECT COUNT(*) FROM jobs AS r WHERE r.user_id = jobs.user_id AND r.stage NOT IN (?, ?)"
+                    " AND r.worker IS NOT NULL AND r.updated >= ?) < ?"
+                    f" ORDER BY {CLAIM_ORDER} LIMIT 1",
+                    (*FINISHED_STAGES, stale, *FINISHED_STAGES, stale, per_user, *FINISHED_STAGES)
+                ).fetchone()
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+
+                job = dict(row)
+                if job['worker'] is not None:
+                    job['resumes'] += 1  # Previous worker died mid-job
+                conn.execute(
+                    "UPDATE jobs SET worker = ?, resumes = ?, updated = ? WHERE id = ?",
+                    (worker, job['resumes'], now, job['id'])
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+            if job['resumes'] > JOB_MAX_RESUMES:
+                self.fail(job['id'], f"gave up after {job['resumes'] - 1} resumes")
+                continue
+            if job['created'] < now - JOB_RESUME_MAX_AGE_HOURS * 3600:
+                self.fail(job['id'], "expired before a worker picked it up")
+                continue
+            job['worker'] = worker
+            incr('jobs_claimed')
+            return job
+
+    def release(self, worker=None):
+        """
+        Hand unfinished solver-worker jobs back to the queue, counted as resumes
+        worker=None releases every worker's jobs. The frontend calls this for
+        workers it knows are dead, so their jobs don't wait out the lease.
+        """
+        sql = ("UPDATE jobs SET worker = NULL, resumes = resumes + 1"
+               " WHERE stage NOT IN (?, ?) AND worker IS NOT NULL AND worker != 'main'")
+        params = FINISHED_STAGES
+        if worker is not None:
+            sql += " AND worker = ?"
+            params += (worker,)
+        return self._conn().execute(sql, params).rowcount
+
+    def start_solve(self, job_id, cache_key, allow_similar, worker):
+        """
+        Record the photo's cache_key and move the job to 'downloaded'
+        If another worker's live job is already solving the same photo, that
+        job is returned instead and this one stays put - the caller waits for
+        it rather than paying Gemini twice. Atomic, so of two processes that
+        download the same photo exactly one solves it.
+        """
+        conn = self._conn()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE cache_key = ? AND stage = 'downloaded' AND allow_similar = ?"
+                " AND id != ? AND worker IS NOT NULL AND worker != ? AND updated >= ? ORDER BY id LIMIT 1",
+                (cache_key, int(allow_similar), job_id, worker, now - JOB_LEASE_SECONDS)
+            ).fetchone()
+            stage = "queued" if row else "downloaded"
+            conn.execute(
+                "UPDATE jobs SET stage = ?, cache_key = ?, updated = ? WHERE id = ?", (stage, cache_key, now, job_id)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        incr('jobs_following' if row else 'jobs_downloaded')
+        return dict(row) if row else None
+
+    def heartbeat(self, job_id, worker):
+        """Renew `worker`'s lease on a job it is still running"""
+        self._conn().execute(
+            "UPDATE jobs SET updated = ? WHERE id = ? AND worker = ?", (time.time(), job_id, worker)
+        )
+
+    def set_status_message(self, job_id, message_id):
+        self._conn().execute("UPDATE jobs SET status_message_id = ? WHERE id = ?", (message_id, job_id))
+
+    def waiting(self):
+        """Unclaimed jobs in claim order -> [{'id', 'user_id', 'chat_id', 'status_message_id'}]"""
+        rows = self._conn().execute(
+            "SELECT id, user_id, chat_id, status_message_id FROM jobs WHERE stage NOT IN (?, ?) AND worker IS NULL"
+            f" ORDER BY {CLAIM_ORDER}",
+            (*FINISHED_STAGES, *FINISHED_STAGES)
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def running_by_user(self):
+        """{user_id: unfinished jobs a worker holds a live lease on}"""
+        rows = self._conn().execute(
+            "SELECT user_id, COUNT(*) FROM jobs WHERE stage NOT IN (?, ?) AND worker IS NOT NULL AND updated >= ?"
+            " GROUP BY user_id",
+            (*FINISHED_STAGES, time.time() - JOB_LEASE_SECONDS)
+        ).fetchall()
+        return {user_id: count for user_id, count in rows}
+
+    def delivered_since(self, since):
+        """Jobs solver workers delivered after `since` -> [{'id', 'user_id', 'updated'}], oldest first"""
+        rows = self._conn().execute(
+            "SELECT id, user_id, updated FROM jobs WHERE stage = 'delivered' AND worker IS NOT NULL"
+            " AND worker != 'main' AND updated > ? ORDER BY updated",
+            (since,)
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def prune(self):
+        cutoff = time.time() - JOB_KEEP_DAYS * 86400
+        cur = self._conn().execute(
+            "DELETE FROM jobs WHERE stage IN (?, ?) AND updated < ?", (*FINISHED_STAGES, cutoff)
+        )
+        return cur.rowcount
+
+    def counts(self):
+        rows = self._conn().execute("SELECT stage, COUNT(*) FROM jobs GROUP BY stage").fetchall()
+        return {stage: count for stage, count in rows}
+
+job_store = JobStore(JOBS_DB)
+
+# ============================================================================
+# ADMIN STATS
+# ============================================================================
+
+def _job_stats():
+    try:
+        counts = job_store.counts()
+    except Exception as e:
+        return [("Error", str(e)[:50])]
+    in_progress = sum(count for stage, count in counts.items() if stage not in FINISHED_STAGES)
+    return [
+        ("In progress", in_progress),
+        ("Waiting for a worker", counts.get('queued', 0)),
+        ("Delivered / failed (7d)", f"{counts.get('delivered', 0)} / {counts.get('failed', 0)}"),
+        ("Resumed after restart", perf_counters['jobs_resumed']),
+        ("Waited on another worker's solve", perf_counters['jobs_following']),
+        ("Solver worker restarts", perf_counters['solver_worker_restarts']),
+        ("Gemini calls saved on resume", perf_counters['jobs_resumed_solved']),
+    ]
+
+register_stats_section("💾 Solve Jobs", _job_stats)
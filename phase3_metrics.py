@@ -0,0 +1,93 @@
+"""
+PHASE 3 METRICS MODULE
+Performance counters and latency history shared by the Phase 3 modules
+
+Author: @aryansmilezzz
+Phase: 3 (Performance)
+"""
+
+from collections import defaultdict, deque
+import logging
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# STORAGE
+# ============================================================================
+
+perf_counters = defaultdict(int)  # {name: count}
+perf_latencies = defaultdict(lambda: deque(maxlen=200))  # {name: deque([seconds, ...])}
+
+# Sections shown in /admin_stats: [(title, provider)]
+# provider() returns a list of (label, value) pairs
+stats_sections = []
+
+# ============================================================================
+# RECORDING
+# ============================================================================
+
+def incr(name, amount=1):
+    """Increment a counter"""
+    perf_counters[name] += amount
+
+def observe(name, seconds):
+    """Record a latency sample"""
+    perf_latencies[name].append(seconds)
+
+def percentile(name, pct, default=None):
+    """Get percentile (0-100) of recent latency samples"""
+    samples = sorted(perf_latencies.get(name, ()))
+    if not samples:
+        return default
+    index = min(len(samples) - 1, int(round(pct / 100 * (len(samples) - 1))))
+    return samples[index]
+
+def register_stats_section(title, provider):
+    """Register a section for /admin_stats"""
+    stats_sections.append((title, provider))
+
+# ============================================================================
+# FORMATTING
+# ============================================================================
+
+MESSAGE_LIMIT = 4000  # Telegram rejects messages over 4096 characters
+
+def escape_markdown(text):
+    """Backslash-escape legacy Markdown specials (half_open, file_unique_id, ...)"""
+    text = str(text)
+    for char in ('_', '*', '`', '['):
+        text = text.replace(char, '\\' + char)
+    return text
+
+def latency_summary(name):
+    """"N ms avg / N ms p95" of recent samples, or None if there are none"""
+    samples = perf_latencies.get(name)
+    if not samples:
+        return None
+    avg = sum(samples) / len(samples) * 1000
+    return f"{avg:.0f} ms avg / {percentile(name, 95) * 1000:.0f} ms p95"
+
+def format_performance_stats():
+    """
+    Format all registered sections for admin stats (Markdown)
+    Returns a list of messages, each under MESSAGE_LIMIT, split between sections
+    """
+    blocks = []
+    for title, provider in stats_sections:
+        try:
+            rows = provider()
+        except Exception as e:
+            logger.error(f"Stats provider error ({title}): {e}")
+            continue
+        if not rows:
+            continue
+        lines = [f"*{title}:*"] + [f"  • {escape_markdown(label)}: {escape_markdown(value)}" for label, value in rows]
+        blocks.append("\n".join(lines)[:MESSAGE_LIMIT])
+
+    messages = []
+    for block in blocks:
+        if messages and len(messages[-1]) + 2 + len(block) <= MESSAGE_LIMIT:
+            messages[-1] += "\n\n" + block
+        else:
+            messages.append(block)
+    return messages
@@ -0,0 +1,72 @@
+"""
+PHASE 3 PROMPT MODULE
+Memoized prompt compiler: prompts are built from named sections once per
+knowledge-base version, with per-section token estimates for /admin_stats
+
+Author: @aryansmilezzz
+Phase: 3 (Performance)
+"""
+
+import json
+import logging
+
+from phase3_metrics import incr, register_stats_section, perf_counters
+from phase3_gemini import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# SERIALIZATION
+# ============================================================================
+
+def compact_json(obj):
+    """JSON without indentation/separator whitespace (indent=2 costs ~30% more tokens)"""
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+# ============================================================================
+# COMPILER
+# ============================================================================
+
+class PromptCompiler:
+    """
+    {prompt_name: (version, text)}
+    build_sections() returns [(section_name, text), ...]; it only runs when
+    the version passed in differs from the one the prompt was built for.
+    """
+
+    def __init__(self):
+        self.compiled = {}
+        self.section_tokens = {}  # {prompt_name: [(section_name, tokens), ...]}
+
+    def compile(self, name, version, build_sections):
+        cached = self.compiled.get(name)
+        if cached is not None and cached[0] == version:
+            incr('prompt_cache_hits')
+            return cached[1]
+
+        sections = build_sections()
+        text = "".join(section for _, section in sections)
+        self.compiled[name] = (version, text)
+        self.section_tokens[name] = [(section_name, estimate_tokens(section)) for section_name, section in sections]
+        incr('prompt_builds')
+        logger.info(f"🧾 Prompt '{name}' built: ~{estimate_tokens(text)} tokens")
+        return text
+
+    def tokens(self, name):
+        return sum(tokens for _, tokens in self.section_tokens.get(name, ()))
+
+prompt_compiler = PromptCompiler()
+
+# ============================================================================
+# ADMIN STATS
+# ============================================================================
+
+def _prompt_stats():
+    rows = [("Builds / reuses", f"{perf_counters['prompt_builds']} / {perf_counters['prompt_cache_hits']}")]
+    for name, sections in prompt_compiler.section_tokens.items():
+        biggest = sorted(sections, key=lambda item: -item[1])[:4]
+        breakdown = ", ".join(f"{section} {tokens}" for section, tokens in biggest)
+        rows.append((name, f"~{prompt_compiler.tokens(name)} tokens ({breakdown})"))
+    return rows
+
+register_stats_section("🧾 Prompt Budget", _prompt_stats)
@@ -0,0 +1,357 @@
+"""
+PHASE 3 RENDER MODULE
+Warm worker processes for WeasyPrint PDF rendering
+Workers import WeasyPrint, load fonts and compile stylesheets once;
+a job is HTML + a stylesheet ID in, PDF bytes out
+Registry of compiled Jinja templates and per-theme stylesheets
+On-disk store of pre-rendered PDFs keyed by content hash
+
+Author: @aryansmilezzz
+Phase: 3 (Performance)
+"""
+
+import os
+import json
+import time
+import hashlib
+import asyncio
+import threading
+import multiprocessing
+import logging
+from jinja2 import Template
+
+from phase3_metrics import incr, observe, register_stats_section, perf_counters, latency_summary
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+RENDER_POOL_WORKERS = int(os.environ.get('RENDER_POOL_WORKERS', 2))  # 0 = render in a thread instead
+RENDER_POOL_QUEUE = int(os.environ.get('RENDER_POOL_QUEUE', 16))  # Max jobs waiting beyond the workers
+RENDER_TIMEOUT = float(os.environ.get('RENDER_TIMEOUT', 60))  # Seconds before a stuck worker is killed
+RENDER_START_TIMEOUT = 60  # Interpreter start + WeasyPrint import + font warmup
+
+# Spawned, not forked: workers are started from threads of a process that holds
+# locks (logging, httpx, SQLite) a forked child could inherit mid-acquire
+render_context = multiprocessing.get_context("spawn")
+PDF_STORE_DIR = "/app/data/pdf_cache" if os.path.exists("/app/data") else "pdf_cache"
+
+class RenderError(Exception):
+    """PDF rendering failed"""
+
+class RenderBusy(RenderError):
+    """Queue is full - callers should not wait behind it"""
+
+# ============================================================================
+# REGISTRY
+# ============================================================================
+
+DEFAULT_THEME = "light"
+
+stylesheets = {}  # {stylesheet_id: css text} - IDs are "<document>-<theme>"
+templates = {}  # {template name: compiled Template}
+
+def register_stylesheet(stylesheet_id, css):
+    """
+    Make `css` available to render_pdf as `stylesheet_id`
+    Workers compile everything registered before they start during warmup,
+    anything later on first use.
+    """
+    stylesheets[stylesheet_id] = css
+
+def stylesheet_for(document, theme):
+    """Stylesheet ID for a document in a theme, falling back to the default theme"""
+    stylesheet_id = f"{document}-{theme}"
+    return stylesheet_id if stylesheet_id in stylesheets else f"{document}-{DEFAULT_THEME}"
+
+def register_template(name, source):
+    templates[name] = Template(source)
+
+def render_template(name, **context):
+    return templates[name].render(**context)
+
+# ============================================================================
+# RENDERER (runs inside worker processes)
+# ============================================================================
+
+class Renderer:
+    """WeasyPrint with fonts loaded and stylesheets compiled once"""
+
+    def __init__(self, preload=None):
+        from weasyprint import HTML, CSS
+        from weasyprint.text.fonts import FontConfiguration
+        self.HTML, self.CSS = HTML, CSS
+        self.font_config = FontConfiguration()
+        self.compiled = {}  # {stylesheet_id: (css text, CSS)}
+        for stylesheet_id, css in (preload or {}).items():
+            self.compiled[stylesheet_id] = (css, CSS(string=css, font_config=self.font_config))
+        HTML(string="<p>warmup</p>").write_pdf(font_config=self.font_config)  # Loads fonts
+
+    def render(self, html, stylesheet_id, css=None):
+        """css is only needed the first time an ID is seen (or when its text changed)"""
+        compiled = self.compiled.get(stylesheet_id)
+        if css is not None and (compiled is None or compiled[0] != css):
+            compiled = (css, self.CSS(string=css, font_config=self.font_config))
+            self.compiled[stylesheet_id] = compiled
+        t0 = time.perf_counter()
+        pdf = self.HTML(string=html).write_pdf(stylesheets=[compiled[1]], font_config=self.font_config)
+        return pdf, time.perf_counter() - t0
+
+def render_worker_main(conn, preload):
+    """Worker process: warm up, then answer (html, stylesheet_id, css) jobs until the pipe closes"""
+    renderer = Renderer(preload)
+    conn.send(os.getpid())
+    while True:
+        try:
+            html, stylesheet_id, css = conn.recv()
+        except (EOFError, OSError):
+            return
+        try:
+            pdf, seconds = renderer.render(html, stylesheet_id, css)
+            conn.send(("ok", pdf, seconds))
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}", 0))
+
+# ============================================================================
+# WORKERS
+# ============================================================================
+
+class RenderWorker:
+    """
+    One pre-started render process and its pipe
+    Blocking methods - called from threads, never on the event loop.
+    A worker that crashes or times out is killed and respawned on its next job.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.process = None
+        self.conn = None
+        self.known = {}  # {stylesheet_id: css text} the process has compiled
+
+    def alive(self):
+        return self.process is not None and self.process.is_alive()
+
+    def start(self):
+        preload = dict(stylesheets)
+        parent_conn, child_conn = render_context.Pipe()
+        self.process = render_context.Process(
+            target=render_worker_main, args=(child_conn, preload), name=self.name, daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.conn = parent_conn
+        self.known = preload
+        if not parent_conn.poll(RENDER_START_TIMEOUT):
+            self.kill()
+            raise RenderError(f"{self.name} did not start")
+        return parent_conn.recv()
+
+    def kill(self):
+        if self.process is not None:
+            self.process.kill()
+            self.process.join(5)
+        if self.conn is not None:
+            self.conn.close()
+        self.process = self.conn = None
+
+    def stop(self):
+        """Close the pipe so the worker exits on its own, then make sure it did"""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+        if self.process is not None:
+            self.process.join(2)
+            if self.process.is_alive():
+                self.process.kill()
+            self.process = None
+
+    def render(self, html, stylesheet_id):
+        if not self.alive():
+            if self.process is not None:
+                self.kill()
+            self.start()
+            incr('render_worker_starts')
+
+        css = stylesheets[stylesheet_id]
+        try:
+            self.conn.send((html, stylesheet_id, css if self.known.get(stylesheet_id) != css else None))
+            if not self.conn.poll(RENDER_TIMEOUT):
+                self.kill()
+                incr('render_timeouts')
+                raise RenderError(f"PDF rendering took over {RENDER_TIMEOUT:.0f}s")
+            status, result, seconds = self.conn.recv()
+        except (EOFError, OSError):
+            self.kill()
+            incr('render_worker_crashes')
+            raise RenderError(f"{self.name} crashed while rendering")
+
+        self.known[stylesheet_id] = css
+        if status != "ok":
+            raise RenderError(result)
+        return result, seconds
+
+# ============================================================================
+# POOL
+# ============================================================================
+
+render_workers = []
+idle_workers = None  # asyncio.Queue of RenderWorker
+render_jobs_waiting = 0
+
+local_renderer = None  # RENDER_POOL_WORKERS=0
+local_render_lock = threading.Lock()
+
+def _render_locally(html, stylesheet_id):
+    global local_renderer
+    with local_render_lock:  # One FontConfiguration, not shared between threads
+        if local_renderer is None:
+            local_renderer = Renderer(stylesheets)
+        return local_renderer.render(html, stylesheet_id, stylesheets[stylesheet_id])
+
+def _render_on_worker(loop, worker, html, stylesheet_id):
+    """Thread body: the worker goes back to the idle queue even if the caller was cancelled"""
+    try:
+        return worker.render(html, stylesheet_id)
+    finally:
+        loop.call_soon_threadsafe(idle_workers.put_nowait, worker)
+
+async def start_render_pool():
+    """Start and warm the render workers (call from startup)"""
+    global idle_workers
+    if RENDER_POOL_WORKERS <= 0:
+        logger.info("📄 Render pool disabled - using a thread")
+        return
+
+    idle_workers = asyncio.Queue()
+    workers = [RenderWorker(f"render-{i + 1}") for i in range(RENDER_POOL_WORKERS)]
+    results = await asyncio.gather(*[asyncio.to_thread(worker.start) for worker in workers], return_exceptions=True)
+    for worker, result in zip(workers, results):
+        if isinstance(result, Exception):
+            logger.error(f"📄 {worker.name} failed to start (retried on first job): {result}")
+        render_workers.append(worker)
+        idle_workers.put_nowait(worker)
+    ready = sum(1 for result in results if not isinstance(result, Exception))
+    logger.info(f"📄 Render pool ready: {ready} warm workers, {len(stylesheets)} stylesheets compiled")
+
+def shutdown_render_pool():
+    global idle_workers
+    for worker in render_workers:
+        worker.stop()
+    render_workers.clear()
+    idle_workers = None
+
+async def render_pdf(html, stylesheet_id):
+    """
+    HTML + registered stylesheet ID -> PDF bytes, rendered off the event loop
+    Raises RenderBusy instead of queueing past RENDER_POOL_QUEUE.
+    """
+    global render_jobs_waiting
+    if stylesheet_id not in stylesheets:
+        raise RenderError(f"Unknown stylesheet: {stylesheet_id}")
+    if render_jobs_waiting >= max(1, RENDER_POOL_WORKERS) + RENDER_POOL_QUEUE:
+        incr('render_rejected')
+        raise RenderBusy("PDF renderer is busy - try again in a minute")
+
+    queued_at = time.perf_counter()
+    render_jobs_waiting += 1
+    try:
+        if idle_workers is None:
+            pdf, seconds = await asyncio.to_thread(_render_locally, html, stylesheet_id)
+        else:
+            worker = await idle_workers.get()
+            observe('render_queue_wait', time.perf_counter() - queued_at)
+            loop = asyncio.get_running_loop()
+            pdf, seconds = await loop.run_in_executor(None, _render_on_worker, loop, worker, html, stylesheet_id)
+    finally:
+        render_jobs_waiting -= 1
+
+    incr('pdfs_rendered')
+    observe('render_layout', seconds)
+    observe('render_total', time.perf_counter() - queued_at)
+    return pdf
+
+# ============================================================================
+# PRE-RENDERED PDFS
+# ============================================================================
+
+def content_digest(*parts):
+    """sha256 over JSON-serializable parts - same content, same digest"""
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, ensure_ascii=False).encode()).hexdigest()
+
+class PdfStore:
+    """
+    Rendered PDFs on disk as {digest}.pdf
+    The digest covers everything that shapes the document (content, stylesheet,
+    layout version), so a changed input is simply a miss and stale files are
+    removed by prune().
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _path(self, digest):
+        return os.path.join(self.directory, f"{digest}.pdf")
+
+    def get(self, digest):
+        try:
+            with open(self._path(digest), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def put(self, digest, pdf):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp = f"{self._path(digest)}.tmp"
+            with open(tmp, 'wb') as f:
+                f.write(pdf)
+            os.replace(tmp, self._path(digest))
+        except Exception as e:
+            logger.error(f"PDF store write error: {e}")
+
+    def prune(self, keep):
+        """Delete stored PDFs whose digest is not in `keep`"""
+        removed = 0
+        try:
+            for name in os.listdir(self.directory):
+                if name.endswith(".pdf") and name[:-4] not in keep:
+                    os.remove(os.path.join(self.directory, name))
+                    removed += 1
+        except FileNotFoundError:
+            pass
+        return removed
+
+    def count(self):
+        try:
+            return sum(1 for name in os.listdir(self.directory) if name.endswith(".pdf"))
+        except FileNotFoundError:
+            return 0
+
+pdf_store = PdfStore(PDF_STORE_DIR)
+
+# ============================================================================
+# ADMIN STATS
+# ============================================================================
+
+def _render_stats():
+    rows = [
+        ("Templates / stylesheets", f"{len(templates)} / {len(stylesheets)}"),
+        ("Workers", f"{sum(1 for worker in render_workers if worker.alive())}/{len(render_workers)}"
+                    if render_workers else "thread"),
+        ("Jobs in pool/queue", render_jobs_waiting),
+        ("Rendered", perf_counters['pdfs_rendered']),
+        ("Rejected (queue full)", perf_counters['render_rejected']),
+        ("Timeouts / crashes", f"{perf_counters['render_timeouts']} / {perf_counters['render_worker_crashes']}"),
+        ("Pre-rendered on disk", pdf_store.count()),
+        ("Pre-rendered hits / misses", f"{perf_counters['pdf_store_hits']} / {perf_counters['pdf_store_misses']}"),
+    ]
+    for name in ["queue_wait", "layout", "total"]:
+        value = latency_summary(f"render_{name}")
+        if value:
+            rows.append((name.replace('_', ' ').title(), value))
+    return rows
+
+register_stats_section("📄 PDF Rendering", _render_stats)
@@ -0,0 +1,179 @@
+"""
+PHASE 3 SCHEDULER MODULE
+Admission control for Gemini solves: global concurrency limit,
+priority queue (admin > returning > first-time), per-user fair share,
+queue position + ETA from recent solve latency
+
+Author: @aryansmilezzz
+Phase: 3 (Performance)
+"""
+
+import os
+import math
+import time
+import heapq
+import asyncio
+import itertools
+from collections import defaultdict
+from contextlib import asynccontextmanager
+import logging
+
+from phase3_metrics import incr, observe, percentile, register_stats_section, perf_counters
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+SOLVE_CONCURRENCY = int(os.environ.get('SOLVE_CONCURRENCY', 4))  # Solves running at once (all users)
+SOLVE_PER_USER = int(os.environ.get('SOLVE_PER_USER', 1))  # Solves running at once per user
+SOLVE_DEFAULT_SECONDS = 120  # ETA guess until there is latency history
+QUEUE_UPDATE_INTERVAL = 10  # Seconds between queue-position checks
+
+PRIORITY_ADMIN = 0
+PRIORITY_RETURNING = 1
+PRIORITY_NEW = 2
+PRIORITY_NAMES = {PRIORITY_ADMIN: "admin", PRIORITY_RETURNING: "returning", PRIORITY_NEW: "new"}
+
+# ============================================================================
+# SCHEDULER
+# ============================================================================
+
+class SolveTicket:
+    """One queued/running solve"""
+
+    def __init__(self, user_id, priority, order):
+        self.user_id = user_id
+        self.priority = priority
+        self.order = order  # Heap key: (priority, user's jobs ahead, arrival)
+        self.future = asyncio.get_running_loop().create_future()
+        self.queued_at = time.time()
+        self.started_at = None
+
+    def __lt__(self, other):
+        return self.order < other.order
+
+class SolveScheduler:
+    """
+    Bounded slots handed out in (priority, fair-share, arrival) order
+    Fair share: a user's Nth waiting job sorts behind everyone's (N-1)th,
+    so one user's burst of photos interleaves with other users instead of
+    blocking them. A user never holds more than per_user slots.
+    """
+
+    def __init__(self, limit, per_user):
+        self.limit = limit
+        self.per_user = per_user
+        self.running = 0
+        self.running_by_user = defaultdict(int)
+        self.waiting = []  # Heap of SolveTicket
+        self.waiting_by_user = defaultdict(int)
+        self.arrivals = itertools.count()
+
+    def _enqueue(self, user_id, priority):
+        order = (priority, self.waiting_by_user[user_id] + self.running_by_user[user_id], next(self.arrivals))
+        ticket = SolveTicket(user_id, priority, order)
+        heapq.heappush(self.waiting, ticket)
+        self.waiting_by_user[user_id] += 1
+        self._dispatch()
+        return ticket
+
+    def _dispatch(self):
+        """Start waiting tickets while slots are free, skipping users at their cap"""
+        skipped = []
+        while self.waiting and self.running < self.limit:
+            ticket = heapq.heappop(self.waiting)
+            if self.running_by_user[ticket.user_id] >= self.per_user:
+                skipped.append(ticket)
+                continue
+            self._forget_waiting(ticket)
+            self.running += 1
+            self.running_by_user[ticket.user_id] += 1
+            ticket.started_at = time.time()
+            observe('solve_queue_wait', ticket.started_at - ticket.queued_at)
+            ticket.future.set_result(True)
+        for ticket in skipped:
+            heapq.heappush(self.waiting, ticket)
+
+    def _forget_waiting(self, ticket):
+        self.waiting_by_user[ticket.user_id] -= 1
+        if not self.waiting_by_user[ticket.user_id]:
+            del self.waiting_by_user[ticket.user_id]
+
+    def _release(self, ticket):
+        if ticket.started_at is not None:
+            self.running -= 1
+            self.running_by_user[ticket.user_id] -= 1
+            if not self.running_by_user[ticket.user_id]:
+                del self.running_by_user[ticket.user_id]
+            observe('solve_slot_seconds', time.time() - ticket.started_at)
+        else:
+            self.waiting.remove(ticket)
+            heapq.heapify(self.waiting)
+            self._forget_waiting(ticket)
+            incr('solve_queue_abandoned')
+        self._dispatch()
+
+    def position(self, ticket):
+        """1-based place in the queue (0 = running)"""
+        if ticket.started_at is not None:
+            return 0
+        return 1 + sum(1 for other in self.waiting if other < ticket)
+
+    def eta_seconds(self, position, slots=None):
+        """Waves of `slots` (default: limit) solves ahead of us, each taking ~p50 solve time"""
+        typical = percentile('solve_slot_seconds', 50, SOLVE_DEFAULT_SECONDS)
+        return math.ceil(position / (slots or self.limit)) * typical
+
+    @asynccontextmanager
+    async def slot(self, user_id, priority=PRIORITY_NEW, on_wait=None):
+        """
+        Hold a solve slot for the duration of the block
+        on_wait(position, eta_seconds) is awaited while queued, whenever the position changes
+        """
+        ticket = self._enqueue(user_id, priority)
+        incr(f"solve_admitted_{PRIORITY_NAMES.get(priority, priority)}")
+        try:
+            last_position = None
+            while not ticket.future.done():
+                position = self.position(ticket)
+                if on_wait and position != last_position:
+                    last_position = position
+                    try:
+                        await on_wait(position, self.eta_seconds(position))
+                    except Exception as e:
+                        logger.error(f"Queue update error: {e}")
+                try:
+                    await asyncio.wait_for(asyncio.shield(ticket.future), QUEUE_UPDATE_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+        except BaseException:
+            self._release(ticket)
+            raise
+
+        try:
+            yield ticket
+        finally:
+            self._release(ticket)
+
+solve_scheduler = SolveScheduler(SOLVE_CONCURRENCY, SOLVE_PER_USER)
+
+# ============================================================================
+# ADMIN STATS
+# ============================================================================
+
+def _scheduler_stats():
+    rows = [
+        ("Running", f"{solve_scheduler.running}/{solve_scheduler.limit}"),
+        ("Queued", len(solve_scheduler.waiting)),
+        ("Admitted (admin/returning/new)",
+         f"{perf_counters['solve_admitted_admin']} / {perf_counters['solve_admitted_returning']} / {perf_counters['solve_admitted_new']}"),
+        ("Abandoned in queue", perf_counters['solve_queue_abandoned']),
+    ]
+    wait = percentile('solve_queue_wait', 95)
+    if wait is not None:
+        rows.append(("Queue wait (p50/p95)", f"{percentile('solve_queue_wait', 50):.0f}s / {wait:.0f}s"))
+    return rows
+
+register_stats_section("🚦 Solve Queue", _scheduler_stats)
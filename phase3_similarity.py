@@ -0,0 +1,293 @@
+"""
+PHASE 3 SIMILARITY MODULE
+Near-duplicate problem detection: perceptual hashing + multi-index hash table
+
+Author: @aryansmilezzz
+Phase: 3 (Performance)
+"""
+
+import os
+import time
+from itertools import combinations
+from PIL import Image, ImageOps
+import logging
+
+from phase3_metrics import incr, observe, register_stats_section, perf_counters, perf_latencies
+from phase3_cache import SOLUTION_CACHE_DIR, solution_cache, normalize_caption, same_problem_text
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+PHASH_MATCH_THRESHOLD = int(os.environ.get('PHASH_MATCH_THRESHOLD', 6))  # Max differing bits (of 64)
+PHASH_INDEX_CHUNKS = 4  # 4 x 16-bit substrings
+
+# ============================================================================
+# PERCEPTUAL HASH
+# ============================================================================
+
+def dhash(img, hash_size=8):
+    """
+    Difference hash (64-bit int) of a PIL image
+    Grayscale + autocontrast first, so lighting differences between
+    two photos of the same printed question mostly cancel out
+    """
+    gray = ImageOps.autocontrast(img.convert('L'))
+    small = gray.resize((hash_size + 1, hash_size), Image.Resampling.BILINEAR)
+    pixels = small.tobytes()
+
+    value = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+def hamming(a, b):
+    return (a ^ b).bit_count()
+
+# ============================================================================
+# MULTI-INDEX HASH TABLE
+# ============================================================================
+
+class MultiIndexHashTable:
+    """
+    Hamming-radius search over 64-bit hashes (Norouzi et al. multi-index hashing)
+    The hash is split into N substrings, each with its own exact-match table.
+    If two hashes differ in <= r bits, at least one substring differs in
+    <= r // N bits, so only a handful of buckets need probing - lookups stay
+    sub-millisecond even with hundreds of thousands of entries.
+    """
+
+    def __init__(self, chunks=PHASH_INDEX_CHUNKS, bits=64):
+        self.chunks = chunks
+        self.chunk_bits = bits // chunks
+        self.mask = (1 << self.chunk_bits) - 1
+        self.tables = [{} for _ in range(chunks)]  # [{substring: [entry_id, ...]}]
+        self.entries = []  # [(hash, solution_key)], None once removed
+        self.ids = {}  # {solution_key: entry_id}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __iter__(self):
+        """(hash, solution_key) of every live entry"""
+        return (self.entries[entry_id] for entry_id in self.ids.values())
+
+    def _substrings(self, value):
+        return [(value >> (i * self.chunk_bits)) & self.mask for i in range(self.chunks)]
+
+    def add(self, value, key):
+        """Index key under value, replacing its previous hash"""
+        entry_id = self.ids.get(key)
+        if entry_id is not None and self.entries[entry_id][0] == value:
+            return
+        self.remove(key)
+        entry_id = len(self.entries)
+        self.entries.append((value, key))
+        self.ids[key] = entry_id
+        for table, sub in zip(self.tables, self._substrings(value)):
+            table.setdefault(sub, []).append(entry_id)
+
+    def remove(self, key):
+        """Drop key from every bucket; returns whether it was indexed"""
+        entry_id = self.ids.pop(key, None)
+        if entry_id is None:
+            return False
+        value, _ = self.entries[entry_id]
+        self.entries[entry_id] = None
+        for table, sub in zip(self.tables, self._substrings(value)):
+            bucket = table[sub]
+            bucket.remove(entry_id)
+            if not bucket:
+                del table[sub]
+        return True
+
+    def _probes(self, sub, radius):
+        """All substrings within `radius` bits of sub"""
+        yield sub
+        for r in range(1, radius + 1):
+            for bits in combinations(range(self.chunk_bits), r):
+                flipped = sub
+                for bit in bits:
+                    flipped ^= 1 << bit
+                yield flipped
+
+    def search(self, value, radius):
+        """Return [(distance, solution_key)] within radius, closest first"""
+        sub_radius = radius // self.chunks
+        seen = set()
+        results = []
+        for table, sub in zip(self.tables, self._substrings(value)):
+            for probe in self._probes(sub, sub_radius):
+                for entry_id in table.get(probe, ()):
+                    if entry_id in seen:
+                        continue
+                    seen.add(entry_id)
+                    stored, key = self.entries[entry_id]
+                    distance = hamming(value, stored)
+                    if distance <= radius:
+                        results.append((distance, key))
+        results.sort()
+        return results
+
+# ============================================================================
+# SIMILAR PROBLEM INDEX
+# ============================================================================
+
+class SimilarProblemIndex:
+    """
+    Persistent perceptual-hash index: one "<hash_hex> <solution_key>" per line
+    Follows the solution cache - evicted keys are dropped, and the append log
+    is compacted on load and once dead lines outnumber live ones. Solver
+    worker processes share the log, so lookups first read what the others
+    appended (same scheme as phase3_cache.FileIndex).
+    """
+
+    def __init__(self, path, threshold):
+        self.path = path
+        self.threshold = threshold
+        self.table = None  # Loaded lazily
+        self.log_lines = 0
+        self.log_stat = None  # (inode, bytes read) of the log
+        solution_cache.evict_listeners.append(self.discard)
+
+    def _load(self):
+        self.table = MultiIndexHashTable()
+        self.log_lines = 0
+        self.log_stat = None
+        self._read(0)
+
+        # Solutions evicted while the index wasn't loaded (or before restart)
+        live = solution_cache.keys_on_disk()
+        for _, key in list(self.table):
+            if key not in live:
+                self.table.remove(key)
+        if self.log_lines > len(self.table):
+            logger.info(f"🔍 Similarity index: compacting {self.log_lines} -> {len(self.table)} lines")
+            self._compact()
+        logger.info(f"🔍 Similarity index: {len(self.table)} problems")
+
+    def _read(self, offset):
+        """Apply the log from byte `offset` on"""
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(offset)
+                data = f.read()
+                inode = os.fstat(f.fileno()).st_ino
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.error(f"Similarity index load error: {e}")
+            return
+
+        end = data.rfind(b"\n") + 1  # A line still being written is read next time
+        for line in data[:end].decode('ascii', 'replace').splitlines():
+            parts = line.split()
+            if len(parts) == 2:
+                self.table.add(int(parts[0], 16), parts[1])
+                self.log_lines += 1
+        self.log_stat = (inode, offset + end)
+
+    def _refresh(self):
+        """Load lazily, then pick up lines other processes appended"""
+        if self.table is None:
+            self._load()
+            return
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return
+        if self.log_stat is None or st.st_ino != self.log_stat[0] or st.st_size < self.log_stat[1]:
+            self._load()  # Compacted by another process
+        elif st.st_size > self.log_stat[1]:
+            self._read(self.log_stat[1])
+
+    def _compact(self):
+        try:
+            tmp = f"{self.path}.tmp"
+            with open(tmp, 'w') as f:
+                for phash, key in self.table:
+                    f.write(f"{phash:016x} {key}\n")
+                f.flush()
+                st = os.fstat(f.fileno())
+            os.replace(tmp, self.path)
+            self.log_lines = len(self.table)
+            self.log_stat = (st.st_ino, st.st_size)
+        except Exception as e:
+            logger.error(f"Similarity index compact error: {e}")
+
+    def add(self, phash, key):
+        """Index a solved problem"""
+        self._refresh()
+        self.table.add(phash, key)
+        try:
+            # Counted when _refresh reads it back, like other processes' lines
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, 'a') as f:
+                f.write(f"{phash:016x} {key}\n")
+        except Exception as e:
+            logger.error(f"Similarity index write error: {e}")
+
+    def discard(self, keys):
+        """Drop evicted solution keys (solution_cache evict listener)"""
+        if self.table is None:
+            return  # _load skips keys that are gone from disk
+        self._refresh()
+        dropped = sum(self.table.remove(key) for key in keys)
+        if dropped:
+            incr('similarity_evicted', dropped)
+            if self.log_lines > 2 * len(self.table):
+                self._compact()
+
+    def candidates(self, phash, caption=""):
+        """Cached solutions within the threshold for the same caption: [(solution_key, entry, distance)]"""
+        self._refresh()
+
+        t0 = time.perf_counter()
+        found = self.table.search(phash, self.threshold)
+        observe('similarity_lookup', time.perf_counter() - t0)
+
+        caption = normalize_caption(caption)
+        results = []
+        for distance, key in found:
+            entry = solution_cache.get(key, record_stats=False)
+            if entry and entry.get('caption', '') == caption:
+                results.append((key, entry, distance))
+        return results
+
+    def find(self, phash, caption, text_key, options):
+        """
+        Closest candidate whose stored transcript is the same question
+        A whole-frame dHash can't tell apart different questions printed in
+        the same layout, so the hash only nominates - the text confirms.
+        Returns (solution_key, entry, distance) or None
+        """
+        for key, entry, distance in self.candidates(phash, caption):
+            if same_problem_text(entry, text_key, options):
+                incr('similarity_matches')
+                return key, entry, distance
+        incr('similarity_unconfirmed')
+        return None
+
+similar_problems = SimilarProblemIndex(os.path.join(SOLUTION_CACHE_DIR, "phash_index.log"), PHASH_MATCH_THRESHOLD)
+
+# ============================================================================
+# ADMIN STATS
+# ============================================================================
+
+def _similarity_stats():
+    samples = perf_latencies.get('similarity_lookup')
+    avg_ms = sum(samples) / len(samples) * 1000 if samples else 0
+    return [
+        ("Indexed problems", len(similar_problems.table) if similar_problems.table is not None else "not loaded"),
+        ("Near-duplicate matches", perf_counters['similarity_matches']),
+        ("Hash matches with different text", perf_counters['similarity_unconfirmed']),
+        ("Fresh solves requested", perf_counters['similarity_rejected']),
+        ("Dropped with evicted solutions", perf_counters['similarity_evicted']),
+        ("Avg lookup", f"{avg_ms:.2f} ms"),
+    ]
+
+register_stats_section("🔍 Near-Duplicate Detection", _similarity_stats)
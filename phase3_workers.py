@@ -0,0 +1,220 @@
+"""
+PHASE 3 WORKERS MODULE
+Warm process pool for CPU-heavy image work (decode, resize, enhance, JPEG encode)
+Keeps the asyncio event loop free for other users' updates
+Single-decode pipeline sized for the Gemini vision tiler
+
+Author: @aryansmilezzz
+Phase: 3 (Performance)
+"""
+
+import os
+import math
+import time
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from PIL import Image, ImageEnhance
+import logging
+
+from phase3_metrics import incr, observe, register_stats_section, perf_counters, perf_latencies, latency_summary
+from phase3_cache import open_rgb_image, solution_key
+from phase3_similarity import dhash
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+IMAGE_POOL_WORKERS = int(os.environ.get('IMAGE_POOL_WORKERS', 2))  # 0 = run in a thread instead
+IMAGE_POOL_QUEUE = int(os.environ.get('IMAGE_POOL_QUEUE', 16))  # Jobs waiting beyond the workers before users are told
+
+# Gemini vision input: 768x768 tiles, ~258 tokens each
+GEMINI_IMAGE_TILE = 768
+GEMINI_IMAGE_MAX_TILES = int(os.environ.get('GEMINI_IMAGE_MAX_TILES', 4))
+GEMINI_IMAGE_BYTE_BUDGET = int(os.environ.get('GEMINI_IMAGE_BYTE_BUDGET', 400000))
+JPEG_QUALITY_LADDER = [90, 85, 78, 70, 60]
+
+IMAGE_STAGES = ["decode", "fingerprint", "resize", "enhance", "encode"]
+
+# ============================================================================
+# WORKER FUNCTIONS (run inside pool processes)
+# ============================================================================
+
+def _warmup():
+    """Force PIL plugins to load so the first real job doesn't pay for it"""
+    Image.init()
+    return os.getpid()
+
+def target_size(width, height, tile=None, max_tiles=None):
+    """
+    Largest size (never upscaled) whose 768px tile grid fits in max_tiles
+    Gemini bills/sees images as 768x768 tiles - pixels beyond that are
+    downscaled server-side anyway, so sending them only costs upload + CPU.
+    """
+    tile = tile or GEMINI_IMAGE_TILE
+    max_tiles = max_tiles or GEMINI_IMAGE_MAX_TILES
+    scale = min(1.0, math.sqrt(max_tiles * tile * tile / (width * height)))
+    while True:
+        w, h = max(1, int(width * scale)), max(1, int(height * scale))
+        if math.ceil(w / tile) * math.ceil(h / tile) <= max_tiles:
+            return w, h
+        scale *= 0.95
+
+def encode_to_budget(img, byte_budget=None):
+    """Encode JPEG once per quality step, stopping at the first that fits the budget"""
+    byte_budget = byte_budget or GEMINI_IMAGE_BYTE_BUDGET
+    for quality in JPEG_QUALITY_LADDER:
+        out = BytesIO()
+        img.save(out, format='JPEG', quality=quality, optimize=True)
+        if out.tell() <= byte_budget:
+            break
+    return out.getvalue()
+
+def prepare_image_job(img_bytes, caption):
+    """
+    One decode for everything the solve needs:
+    exact cache key + perceptual hash -> resize to model size -> enhance -> JPEG to byte budget
+    Returns ((solution_key, dhash, jpeg_bytes), {stage: seconds})
+    """
+    timings = {}
+
+    t0 = time.perf_counter()
+    img = open_rgb_image(img_bytes)
+    img.load()
+    timings['decode'] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    key = solution_key(img, caption)
+    phash = dhash(img)
+    timings['fingerprint'] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    size = target_size(*img.size)
+    if size != img.size:
+        img = img.resize(size, Image.Resampling.LANCZOS)
+    timings['resize'] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    img = ImageEnhance.Contrast(img).enhance(1.3)
+    img = ImageEnhance.Sharpness(img).enhance(1.2)
+    img = ImageEnhance.Brightness(img).enhance(1.1)
+    timings['enhance'] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    jpeg = encode_to_budget(img)
+    timings['encode'] = time.perf_counter() - t0
+
+    return (key, phash, jpeg), timings
+
+# ============================================================================
+# POOL
+# ============================================================================
+
+# Spawned, not forked: the pool is (re)started while executor/to_thread threads
+# exist, and a forked child can inherit a lock one of them held (as phase3_render)
+image_context = multiprocessing.get_context("spawn")
+
+image_pool = None
+image_slots = None  # Semaphore: one per worker - the pool never holds more jobs than it can run
+image_jobs_waiting = 0
+
+async def start_image_pool():
+    """Start and warm the pool (call from startup)"""
+    global image_pool, image_slots
+    image_slots = asyncio.Semaphore(max(1, IMAGE_POOL_WORKERS))
+    if IMAGE_POOL_WORKERS <= 0:
+        logger.info("🖼️ Image pool disabled - using threads")
+        return
+
+    image_pool = ProcessPoolExecutor(max_workers=IMAGE_POOL_WORKERS, mp_context=image_context)
+    loop = asyncio.get_running_loop()
+    pids = await asyncio.gather(*[
+        loop.run_in_executor(image_pool, _warmup) for _ in range(IMAGE_POOL_WORKERS)
+    ])
+    logger.info(f"🖼️ Image pool ready: {len(set(pids))} warm workers")
+
+def shutdown_image_pool():
+    global image_pool
+    if image_pool is not None:
+        image_pool.shutdown(wait=False, cancel_futures=True)
+        image_pool = None
+
+def _replace_broken_pool(broken):
+    """A worker died (crash/OOM kill) - the executor refuses all further jobs, so start a new one"""
+    global image_pool
+    if image_pool is not broken:
+        return  # Another job already replaced it
+    broken.shutdown(wait=False, cancel_futures=True)
+    image_pool = ProcessPoolExecutor(max_workers=IMAGE_POOL_WORKERS, mp_context=image_context)
+    incr('image_pool_restarts')
+    logger.warning("🖼️ Image pool broken - started a new one")
+
+async def run_image_job(fn, *args, on_wait=None):
+    """
+    Run an image job off the event loop
+    Jobs beyond the workers wait their turn here; once more than
+    IMAGE_POOL_QUEUE are waiting, on_wait() is awaited so the user knows.
+    A broken pool is replaced and the job retried once.
+    """
+    global image_slots, image_jobs_waiting
+    if image_slots is None:
+        image_slots = asyncio.Semaphore(max(1, IMAGE_POOL_WORKERS))
+    if on_wait and image_jobs_waiting >= max(1, IMAGE_POOL_WORKERS) + IMAGE_POOL_QUEUE:
+        incr('image_jobs_delayed')
+        try:
+            await on_wait()
+        except Exception as e:
+            logger.error(f"Image queue update error: {e}")
+
+    queued_at = time.perf_counter()
+    image_jobs_waiting += 1
+    try:
+        async with image_slots:
+            loop = asyncio.get_running_loop()
+            started = time.perf_counter()
+            observe('image_queue_wait', started - queued_at)
+            pool = image_pool
+            try:
+                result, timings = await loop.run_in_executor(pool, fn, *args)
+            except BrokenProcessPool:
+                _replace_broken_pool(pool)
+                result, timings = await loop.run_in_executor(image_pool, fn, *args)
+    finally:
+        image_jobs_waiting -= 1
+
+    for stage, seconds in timings.items():
+        observe(f"image_{stage}", seconds)
+    observe('image_total', time.perf_counter() - queued_at)
+    return result
+
+async def prepare_image(img_bytes, caption="", on_wait=None):
+    """Decode once -> (solution_key, dhash, model-sized JPEG bytes)"""
+    key, phash, jpeg = await run_image_job(prepare_image_job, img_bytes, caption, on_wait=on_wait)
+    observe('image_upload_kb', len(jpeg) / 1024)
+    return key, phash, jpeg
+
+# ============================================================================
+# ADMIN STATS
+# ============================================================================
+
+def _image_pool_stats():
+    rows = [
+        ("Workers", IMAGE_POOL_WORKERS if image_pool is not None else "threads"),
+        ("Jobs in pool/queue", image_jobs_waiting),
+        ("Long waits / pool restarts",
+         f"{perf_counters['image_jobs_delayed']} / {perf_counters['image_pool_restarts']}"),
+    ]
+    for stage in IMAGE_STAGES + ["queue_wait", "total"]:
+        value = latency_summary(f"image_{stage}")
+        if value:
+            rows.append((stage.replace('_', ' ').title(), value))
+    uploads = perf_latencies.get('image_upload_kb')
+    if uploads:
+        rows.append(("Upload size", f"{sum(uploads) / len(uploads):.0f} KB avg"))
+    return rows
+
+register_stats_section("🖼️ Image Pipeline", _image_pool_stats)